@@ -26,8 +26,20 @@ CREDENTIALS_PATHS = [
 ]
 
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+# Requested during setup but not required: lets change checks ask Drive for the file version
+OPTIONAL_SCOPES = ['https://www.googleapis.com/auth/drive.metadata.readonly']
 REDIRECT_URI = 'http://localhost:8080'
 
+def token_scopes() -> list:
+    """Required scopes plus the optional ones the saved token was granted (keeps them on refresh)"""
+    try:
+        with open(TOKEN_PATH) as token:
+            granted = json.load(token).get('scopes') or []
+    except (OSError, ValueError):
+        granted = []
+    granted = granted.split() if isinstance(granted, str) else granted
+    return SCOPES + [scope for scope in OPTIONAL_SCOPES if scope in granted]
+
 def find_credentials() -> Optional[Path]:
     """Find credentials.json in any of the expected locations"""
     for path in CREDENTIALS_PATHS:
@@ -50,7 +62,7 @@ def check_status():
     
     if TOKEN_PATH.exists():
         try:
-            creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
+            creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), token_scopes())
             print(f"Token valid: {'✓' if creds.valid else '✗'}")
             print(f"Token expired: {'Yes' if creds.expired else 'No'}")
             if creds.expiry:
@@ -95,7 +107,7 @@ def setup_oauth_auto():
     try:
         # Use installed app flow for automatic handling
         flow = InstalledAppFlow.from_client_secrets_file(
-            str(creds_path), SCOPES
+            str(creds_path), SCOPES + OPTIONAL_SCOPES
         )
         
         print("\n🌐 Opening browser for authentication...")
@@ -143,7 +155,7 @@ def setup_oauth_manual():
     # Create OAuth flow
     flow = Flow.from_client_secrets_file(
         str(creds_path),
-        scopes=SCOPES,
+        scopes=SCOPES + OPTIONAL_SCOPES,
         redirect_uri=REDIRECT_URI
     )
     
@@ -207,7 +219,7 @@ def test_auth():
         from googleapiclient.discovery import build
         from googleapiclient.errors import HttpError
         
-        creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
+        creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), token_scopes())
         
         # Refresh if needed
         if creds.expired and creds.refresh_token:
@@ -8,9 +8,17 @@ import os
 import sqlite3
 import re
 import hashlib
+import itertools
+import random
+import socket
 import time
+import uuid
 import logging
-import gc
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -28,12 +36,55 @@ import mcp.server.stdio
 
 # Google imports
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 
 # Constants
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+# Used when the token grants it; tokens from older setups keep working without it
+DRIVE_METADATA_SCOPE = 'https://www.googleapis.com/auth/drive.metadata.readonly'
+# Optional Drive API endpoint override (e.g. a local stand-in for tests)
+DRIVE_API_ENDPOINT = os.environ.get('GOOGLE_DRIVE_API_ENDPOINT')
 MAX_ROWS_PER_SYNC = 100000  # Default limit - balances completeness with performance
 
+# Columns added to _sheet_metadata after the original schema (applied to existing databases on startup)
+METADATA_COLUMNS = {
+    "grid_row_count": "INTEGER",  # gridProperties.rowCount at last sync
+    "grid_column_count": "INTEGER",  # gridProperties.columnCount at last sync
+    "tail_row_count": "INTEGER",  # Number of trailing rows covered by tail_fingerprint
+    "tail_fingerprint": "TEXT",  # Fingerprint of the last synced rows (append mode)
+    "headers": "TEXT",  # JSON list of the sheet's header row as synced
+    "column_types": "TEXT",  # JSON list of the inferred column types, aligned with headers
+    "value_render": "TEXT",  # 'formatted' or 'unformatted' values API rendering of the last sync
+    "data_row_count": "INTEGER",  # Last non-empty sheet row (header included) at last sync
+    "drive_version": "TEXT",  # Drive file version when the tab was last verified in step
+    "drive_modified_time": "TEXT",  # Drive modifiedTime at the same point
+    "keep_formatted": "INTEGER",  # 1 when the last sync added formatted companion columns
+    "max_rows": "INTEGER",  # max_rows the last sync was asked for (background refresh reuses it)
+    "block_root": "TEXT",  # Hash over the table's _block_hashes in block order (NULL while any is unknown)
+    "hash_state": "TEXT",  # ContentHash state after the last row, so an append can continue the content hash
+}
+
+# Field mask for spreadsheets().get - titles and grid sizes only, never formats or named ranges
+SPREADSHEET_METADATA_FIELDS = "properties.title,sheets.properties(sheetId,title,index,gridProperties(rowCount,columnCount))"
+
+# (spreadsheet_id, fields) -> (fetch time, response), shared by every service instance
+_spreadsheet_metadata_cache: Dict[tuple, tuple] = {}
+
+# values API render options per smart_sync value_render setting
+VALUE_RENDER_OPTIONS = {
+    "formatted": {},
+    "unformatted": {"valueRenderOption": "UNFORMATTED_VALUE", "dateTimeRenderOption": "SERIAL_NUMBER"},
+}
+
+# Cell patterns for column type inference; numbers must also read back as the same text.
+# Integers stop at 15 digits, so a column widened to REAL still holds them exactly.
+INTEGER_PATTERN = re.compile(r'-?(0|[1-9][0-9]{0,14})')
+REAL_PATTERN = re.compile(r'-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]{1,2})?')
+DATE_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}([ T][0-9]{2}:[0-9]{2}(:[0-9]{2})?)?')
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -44,23 +95,362 @@ app = Server(
     version="1.0.0"
 )
 
+class CallBudgetExhausted(Exception):
+    """An API call was refused because the caller's call budget is spent"""
+
+class TokenBucket:
+    """Async token bucket: O(1) per acquire, callers are served in arrival order.
+    
+    Each acquire takes a token immediately, letting the balance go negative; the
+    caller then sleeps until the refill covers its place in line. Only touched
+    from the event loop, so no lock is needed.
+    
+    The rate adapts AIMD-style between min_rate and max_rate: every successful
+    call adds increase_step, a throttled call halves it. Throttles reported for
+    calls admitted before the last decrease are ignored, so one burst of 429s
+    only halves the rate once.
+    """
+    
+    def __init__(self, rate: float, capacity: float, min_rate: Optional[float] = None,
+                 max_rate: Optional[float] = None, increase_step: float = 0.0):
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity  # Largest burst allowed after an idle period
+        self.min_rate = min_rate or rate
+        self.max_rate = max_rate or rate
+        self.increase_step = increase_step  # Rate added per successful call
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.last_decrease = 0.0
+        self.calls = deque()  # Acquire times within the last minute, for reporting
+    
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self) -> float:
+        """Wait for a token; returns the admission time to pass back to throttled()"""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        self._prune_calls(now)
+        self.calls.append(now)
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+        return now
+    
+    def succeeded(self):
+        """Additive increase after a call that was not throttled"""
+        self._refill(time.monotonic())
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+    
+    def throttled(self, admitted_at: float):
+        """Multiplicative decrease after a quota error"""
+        if admitted_at < self.last_decrease:
+            return
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.last_decrease = now
+    
+    def _prune_calls(self, now: float):
+        """Drop acquire times older than a minute, so calls stays bounded between reports"""
+        cutoff = now - 60
+        while self.calls and self.calls[0] < cutoff:
+            self.calls.popleft()
+    
+    def calls_in_last_minute(self) -> int:
+        self._prune_calls(time.monotonic())
+        return len(self.calls)
+
+class QuotaLedger:
+    """Token bucket shared by every server process using the same database.
+    
+    Each Claude session runs its own server, but they all spend one Google
+    quota. The bucket lives in a _rate_limit_ledger row; processes lease a few
+    tokens at a time in a short BEGIN IMMEDIATE transaction and spend them
+    locally. Unused leased tokens expire after lease_seconds, so a process that
+    goes quiet cannot save them up for a later burst.
+    """
+    
+    def __init__(self, db_path: Path, name: str, rate: float, capacity: float,
+                 lease_size: int = 5, lease_seconds: float = 5.0):
+        self.db_path = db_path
+        self.name = name
+        self.rate = rate  # Tokens added per second, across all processes
+        self.capacity = capacity
+        self.lease_size = lease_size
+        self.lease_seconds = lease_seconds
+        self.leased = 0
+        self.lease_expires = 0.0
+        self.lock = None  # asyncio.Lock serializing leases, created on first use inside the event loop
+    
+    async def acquire(self):
+        """Take one token, leasing more from the shared bucket when the local lease is used up"""
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        
+        # Concurrent callers lease one at a time, so a lease is never overwritten by another
+        async with self.lock:
+            if self.leased > 0 and time.time() < self.lease_expires:
+                self.leased -= 1
+                return
+            
+            loop = asyncio.get_running_loop()
+            try:
+                wait, taken, leased_at = await loop.run_in_executor(None, self._lease)
+            except sqlite3.Error as e:
+                # The in-process limiter still applies; don't fail API calls over the ledger
+                logger.warning(f"Quota ledger unavailable: {e}")
+                return
+            
+            self.leased = taken - 1
+            self.lease_expires = leased_at + wait + self.lease_seconds
+        
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def _lease(self):
+        """Take up to lease_size tokens; returns (seconds until the first is due, tokens taken, time)"""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = conn.execute("SELECT tokens, updated FROM _rate_limit_ledger WHERE name = ?",
+                               (self.name,)).fetchone()
+            tokens = self.capacity
+            if row:
+                tokens = min(self.capacity, row[0] + max(0.0, now - row[1]) * self.rate)
+            
+            # A full lease when tokens are available; otherwise queue for one (the balance goes negative)
+            taken = max(1, min(self.lease_size, int(tokens)))
+            tokens -= taken
+            conn.execute("INSERT OR REPLACE INTO _rate_limit_ledger (name, tokens, updated) VALUES (?, ?, ?)",
+                         (self.name, tokens, now))
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return max(0.0, -tokens / self.rate), taken, now
+
+class SyncLocks:
+    """One sync at a time per table, within and across server processes.
+    
+    An ingest's private tables (_staging_<name>, _delta_<name>) and its
+    _sync_checkpoints row are named after the table, so two syncs of the same
+    tab would collide. In-process syncs queue on an asyncio.Lock per table;
+    across processes the holder keeps a _sync_locks row whose lease it renews
+    while it syncs, so the lock of a crashed process expires.
+    """
+    
+    def __init__(self, db_path: Path, lease_seconds: float = 60.0, poll_seconds: float = 0.5):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds  # How often a process waiting for another one retries
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.locks = {}  # Table name -> (asyncio.Lock, syncs holding or waiting for it)
+    
+    @asynccontextmanager
+    async def hold(self, table_name: str):
+        """Hold the lock of table_name for the duration of the block"""
+        lock, users = self.locks.get(table_name) or (asyncio.Lock(), 0)
+        self.locks[table_name] = (lock, users + 1)
+        try:
+            async with lock:
+                loop = asyncio.get_running_loop()
+                while not await loop.run_in_executor(None, self._claim, table_name):
+                    await asyncio.sleep(self.poll_seconds)
+                renewal = asyncio.ensure_future(self._renew(table_name))
+                try:
+                    yield
+                finally:
+                    renewal.cancel()
+                    await loop.run_in_executor(None, self._release, table_name)
+        finally:
+            # Forget idle locks, so the dict only holds tables being synced
+            lock, users = self.locks[table_name]
+            if users == 1:
+                del self.locks[table_name]
+            else:
+                self.locks[table_name] = (lock, users - 1)
+    
+    async def _renew(self, table_name: str):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            await loop.run_in_executor(None, self._claim, table_name)
+    
+    def _claim(self, table_name: str) -> bool:
+        """Take or extend the lease on table_name unless another process holds it"""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = conn.execute("SELECT owner, expires_at FROM _sync_locks WHERE table_name = ?",
+                               (table_name,)).fetchone()
+            if row and row[0] != self.owner and row[1] > now:
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute("INSERT OR REPLACE INTO _sync_locks (table_name, owner, expires_at) VALUES (?, ?, ?)",
+                         (table_name, self.owner, now + self.lease_seconds))
+            conn.execute("COMMIT")
+            return True
+        finally:
+            conn.close()
+    
+    def _release(self, table_name: str):
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            conn.execute("DELETE FROM _sync_locks WHERE table_name = ? AND owner = ?", (table_name, self.owner))
+            conn.commit()
+        finally:
+            conn.close()
+
+# Sheets API quota is per user and project, so every tool call in the process draws from one bucket.
+# The limiter starts at the quota and backs off when Google starts throttling.
+SHEETS_QUOTA_PER_MINUTE = int(os.environ.get('SHEETS_QUOTA_PER_MINUTE', '60'))  # Read requests per user per minute
+MIN_CALLS_PER_MINUTE = 6  # Floor the limiter never backs off below
+RATE_LIMIT_BURST = 5  # Calls allowed back to back after an idle period
+_sheets_rate_limiter = TokenBucket(SHEETS_QUOTA_PER_MINUTE / 60, RATE_LIMIT_BURST,
+                                   min_rate=MIN_CALLS_PER_MINUTE / 60,
+                                   max_rate=SHEETS_QUOTA_PER_MINUTE / 60,
+                                   increase_step=1 / 60 / 60)  # +1 call/minute for every 60 successful calls
+
+# API calls made in the current context are added here when a caller sets a counter dict; with a
+# "limit" key, calls past it raise CallBudgetExhausted (the background refresh's per-cycle budget)
+_api_call_counter: ContextVar[Optional[Dict[str, int]]] = ContextVar('api_call_counter', default=None)
+
+# Background sync jobs started by this process (job_id -> job dict, see start_sync_job); the
+# _sync_jobs table keeps their saved progress and outcome for sync_status
+_sync_jobs: Dict[str, Dict[str, Any]] = {}
+_sync_job_tasks = set()  # Strong references so running jobs are not garbage collected
+
+# Row counters of the sync running in this context: a background job, or a foreground call whose
+# client asked for progress notifications (see _progress_for_request). _current_sheet names the tab.
+_current_progress: ContextVar[Optional[Dict[str, Any]]] = ContextVar('current_progress', default=None)
+_current_sheet: ContextVar[Optional[str]] = ContextVar('current_sheet', default=None)
+SYNC_JOB_COLUMNS = ["job_id", "tool", "arguments", "status", "started_at", "updated_at", "finished_at",
+                    "rows_expected", "rows_fetched", "rows_inserted", "errors", "result"]
+
+# Optional background refresh of stale synced tabs (disabled unless an interval is set)
+REFRESH_INTERVAL_SECONDS = float(os.environ.get('SHEETS_REFRESH_INTERVAL_SECONDS', '0'))
+REFRESH_CALL_BUDGET = int(os.environ.get('SHEETS_REFRESH_CALL_BUDGET', '20'))  # API calls per refresh cycle
+
+# Errors worth retrying: quota (429 / 403 rate limit reasons) and transient server failures
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "quotaExceeded"}
+
+class ContentHash:
+    """Order-sensitive content hash built from row digests, continued from its state.
+    
+    Every row is hashed once (see GoogleSheetsService._row_digests). The rows are
+    grouped in blocks of block_rows (the header is a block of its own, so data
+    blocks line up with _block_hashes), each block is hashed from its row digests
+    and the block hashes are chained. state() holds the chain and the digests of
+    an unfinished block, so an append or resumed sync can continue from it and
+    still end with the digest a full pass over the sheet gives.
+    """
+    
+    def __init__(self, block_rows: int, state: Optional[str] = None):
+        self.block_rows = block_rows
+        self.next_row = 0
+        self.chain = bytes(16)
+        self.pending = []  # Row digests of the unfinished block
+        if state:
+            next_row, chain, pending = state.split(":")
+            self.next_row = int(next_row)
+            self.chain = bytes.fromhex(chain)
+            self.pending = [bytes.fromhex(pending[i:i + 32]) for i in range(0, len(pending), 32)]
+    
+    @staticmethod
+    def block_hash(row_digests: List[bytes]) -> bytes:
+        return hashlib.blake2b(b"".join(row_digests), digest_size=16).digest()
+    
+    def update(self, row_digests: List[bytes]) -> List[bytes]:
+        """Add the digests of the next rows; returns the hashes of the blocks they complete"""
+        completed = []
+        start = 0
+        while start < len(row_digests):
+            # Blocks end at rows 0, block_rows, 2 * block_rows, ...
+            end = start + (-self.next_row) % self.block_rows + 1
+            self.pending.extend(row_digests[start:end])
+            self.next_row += len(row_digests[start:end])
+            if end <= len(row_digests):
+                completed.append(self.block_hash(self.pending))
+                self.chain = hashlib.blake2b(self.chain + completed[-1], digest_size=16).digest()
+                self.pending = []
+            start = end
+        return completed
+    
+    def state(self) -> str:
+        return f"{self.next_row}:{self.chain.hex()}:{b''.join(self.pending).hex()}"
+    
+    def hexdigest(self) -> str:
+        return hashlib.blake2b(self.chain + b"".join(self.pending), digest_size=16).hexdigest()
+
 class GoogleSheetsService:
     def __init__(self):
         self.db_path = PROJECT_ROOT / 'data' / 'sheets_data.sqlite'
         self.db_path.parent.mkdir(exist_ok=True)
         self._init_database()
         
-        # Rate limiting and throttling
-        self.api_calls = []  # Track API call timestamps
-        self.max_calls_per_minute = 50  # Conservative limit
-        self.min_delay_between_calls = 0.6  # 600ms between calls
-        self.last_api_call = 0
+        # Rate limiting (process-wide bucket, see TokenBucket; quota shared with other processes,
+        # see QuotaLedger) and retries
+        self.rate_limiter = _sheets_rate_limiter
+        self.quota_ledger = QuotaLedger(self.db_path, "sheets", SHEETS_QUOTA_PER_MINUTE / 60, RATE_LIMIT_BURST)
+        self.sync_locks = SyncLocks(self.db_path)  # One sync per table at a time
+        self.max_api_retries = 5
+        self.retry_base_delay = 1.0  # Seconds; doubles per attempt, with full jitter
+        self.retry_max_delay = 64.0
+        
+        # Concurrent request execution (googleapiclient is blocking and httplib2 is not thread-safe)
+        self.max_inflight_requests = 4  # Outstanding range requests per chunked fetch
+        self.max_concurrent_tabs = 4  # Tabs of one spreadsheet synced at the same time
+        self.chunking_threshold_rows = 10000  # Larger tabs are fetched in chunks
+        self.append_tail_rows = 5  # Trailing rows verified before an append-mode sync
+        self.block_rows = 1000  # Data rows per content block (see _block_hashes)
+        self.checkpoint_max_age_seconds = 3600  # Older chunk checkpoints are discarded instead of resumed
+        
+        # Extent estimate for a chunked tab's first sync (see _estimate_row_extent)
+        self.extent_probe_windows = 32  # Full-width windows spread down the grid
+        self.extent_probe_rows = 20  # Rows per window
+        self.extent_probe_cells = 50000  # Cells read by all windows together
+        
+        # batchGet planning for small tabs (quota is per request, not per byte)
+        self.batch_get_byte_budget = 8 * 1024 * 1024  # Target response size per batchGet
+        self.batch_get_max_ranges = 100
+        self.estimated_bytes_per_cell = 16
+        
+        # Range planning: requests are sized by cells so wide sheets never produce oversized responses
+        self.max_cells_per_request = self.batch_get_byte_budget // self.estimated_bytes_per_cell
+        self.max_columns_per_request = 200  # Wider sheets are fetched in side-by-side column blocks
+        
+        # Adaptive chunk sizing: each chunked range is resized from the bytes and time of the last one
+        self.chunk_target_bytes = 4 * 1024 * 1024  # Response size aimed for per range request
+        self.chunk_target_seconds = 5.0  # Request time aimed for (excluding rate-limit waits)
+        self.chunk_min_rows = 500
+        self.chunk_max_growth = 2.0  # Largest factor the row count changes by between chunks
+        # API clients live as long as the service; they are rebuilt only when token.json is reloaded
+        self.credentials = None
+        self.granted_scopes = set()
+        self._token_mtime = None
+        self._sheets_service = None
+        self._drive_service = None
+        self._executor = ThreadPoolExecutor(max_workers=self.max_inflight_requests * 2,
+                                            thread_name_prefix="sheets-api")
+        self._thread_local = threading.local()
+        
+        # Single writer thread for sync database work (one connection, serialized statements)
+        self._db_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
         
         # Change debouncing
         self.pending_changes = {}  # spreadsheet_id -> last_change_time
         self.debounce_seconds = 5  # Wait 5 seconds after last change before syncing
         
+        # Background jobs
+        self.job_progress_interval = 2.0  # Seconds between saves of a running job's progress
+        self.job_stale_seconds = 300  # Running jobs not saved for this long are reported as interrupted
+        
         # Cache management
+        self.metadata_cache_ttl_seconds = 30  # Reuse spreadsheet metadata across tabs and tool calls
         self.cache_ttl_seconds = 300  # 5 minutes default cache TTL
         self.force_refresh_threshold = 86400  # Force refresh after 24 hours
     
@@ -90,6 +480,83 @@ class GoogleSheetsService:
                     PRIMARY KEY (spreadsheet_id, sheet_name)
                 )
             """)
+            self._migrate_metadata_table(conn)
+            
+            # Per-row fingerprints used by delta sync (row_id is the row's position in the sheet)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS _row_fingerprints (
+                    table_name TEXT,
+                    row_id INTEGER,
+                    fingerprint TEXT,
+                    PRIMARY KEY (table_name, row_id)
+                ) WITHOUT ROWID
+            """)
+            
+            # Content hash of every block of block_rows data rows (block 0 holds row_ids 1..block_rows);
+            # re-syncs skip the blocks whose hash is unchanged
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS _block_hashes (
+                    table_name TEXT,
+                    block_index INTEGER,
+                    block_hash TEXT,
+                    PRIMARY KEY (table_name, block_index)
+                ) WITHOUT ROWID
+            """)
+            
+            # Committed chunks of chunked ingests, so an interrupted sync can resume (see _get_resume_state)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS _sync_checkpoints (
+                    table_name TEXT,
+                    start_row INTEGER,
+                    end_row INTEGER,
+                    prefix_hash TEXT,
+                    spreadsheet_id TEXT,
+                    sheet_name TEXT,
+                    sync_mode TEXT,
+                    value_render TEXT,
+                    grid_row_count INTEGER,
+                    grid_column_count INTEGER,
+                    state TEXT,
+                    created_at REAL,
+                    PRIMARY KEY (table_name, end_row)
+                )
+            """)
+            
+            # Background sync jobs (see start_sync_job)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS _sync_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    tool TEXT,
+                    arguments TEXT,
+                    status TEXT,
+                    started_at REAL,
+                    updated_at REAL,
+                    finished_at REAL,
+                    rows_expected INTEGER,
+                    rows_fetched INTEGER,
+                    rows_inserted INTEGER,
+                    errors TEXT,
+                    result TEXT
+                )
+            """)
+            
+            # Cross-process rate limit buckets (see QuotaLedger)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS _rate_limit_ledger (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL,
+                    updated REAL
+                )
+            """)
+            
+            # Tables being synced, so concurrent syncs of one tab wait their turn (see SyncLocks)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS _sync_locks (
+                    table_name TEXT PRIMARY KEY,
+                    owner TEXT,
+                    expires_at REAL
+                )
+            """)
             
             # Add indexes for commonly queried columns
             conn.execute("""
@@ -105,6 +572,13 @@ class GoogleSheetsService:
                 ON _sheet_metadata(table_name)
             """)
     
+    def _migrate_metadata_table(self, conn: sqlite3.Connection):
+        """Add any metadata columns missing from databases created by older versions"""
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(_sheet_metadata)")}
+        for column, column_type in METADATA_COLUMNS.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE _sheet_metadata ADD COLUMN {column} {column_type}")
+    
     def _get_db_connection(self) -> sqlite3.Connection:
         """Get a database connection with optimal settings for large datasets"""
         conn = sqlite3.connect(self.db_path, timeout=30.0)
@@ -117,13 +591,28 @@ class GoogleSheetsService:
         return conn
     
     def get_credentials(self) -> Optional[Credentials]:
-        """Get Google credentials"""
+        """Get Google credentials (loaded once, refreshed when expired, reloaded when token.json changes)"""
         token_path = PROJECT_ROOT / 'data' / 'token.json'
         if not token_path.exists():
+            self._reset_credentials()
             return None
         
         try:
-            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            creds = self.credentials
+            token_mtime = token_path.stat().st_mtime
+            if creds is None or token_mtime != self._token_mtime:
+                # Remember what the token was granted so optional features can check for their scope
+                with open(token_path) as token:
+                    granted = json.load(token).get('scopes') or []
+                self.granted_scopes = set(granted.split() if isinstance(granted, str) else granted)
+                
+                # Load with the granted optional scopes too, so refreshed tokens (and the saved file) keep them
+                optional_scopes = [scope for scope in (DRIVE_METADATA_SCOPE,) if scope in self.granted_scopes]
+                creds = Credentials.from_authorized_user_file(str(token_path), SCOPES + optional_scopes)
+                
+                # New credentials invalidate the clients and transports built on the old ones
+                self._reset_credentials()
+                self._token_mtime = token_mtime
             
             # Refresh token if expired
             if creds and creds.expired and creds.refresh_token:
@@ -133,12 +622,27 @@ class GoogleSheetsService:
                 # Save the refreshed token
                 with open(token_path, 'w') as token:
                     token.write(creds.to_json())
+                self._token_mtime = token_path.stat().st_mtime
             
-            return creds if creds and creds.valid else None
+            self.credentials = creds if creds and creds.valid else None
+            return self.credentials
         except Exception as e:
             print(f"Error loading credentials: {e}")
             return None
     
+    def _reset_credentials(self):
+        """Forget the loaded credentials and every client built from them"""
+        self.credentials = None
+        self._token_mtime = None
+        self._sheets_service = None
+        self._drive_service = None
+    
+    def get_sheets_service(self, creds: Credentials):
+        """Sheets API resource, built once and reused for as long as creds stay loaded"""
+        if self._sheets_service is None:
+            self._sheets_service = build('sheets', 'v4', credentials=creds)
+        return self._sheets_service
+    
     def extract_spreadsheet_id(self, url: str) -> Optional[str]:
         """Extract spreadsheet ID from URL"""
         patterns = [
@@ -154,75 +658,1230 @@ class GoogleSheetsService:
     
     def _calculate_content_hash(self, values: List[List[str]]) -> str:
         """Calculate hash of sheet content for change detection"""
-        content_str = json.dumps(values, sort_keys=True)
-        return hashlib.md5(content_str.encode()).hexdigest()
+        hasher = ContentHash(self.block_rows)
+        hasher.update(self._row_digests(values))
+        return hasher.hexdigest()
+    
+    def _new_content_hasher(self):
+        """Digest used for tail fingerprints and block roots"""
+        return hashlib.blake2b(digest_size=16)
+    
+    def _encode_rows(self, rows: List[List[Any]]) -> bytes:
+        """Compact encoding of rows for hashing.
+        
+        Cells are joined with \\x1f and every row ends with \\x1e, so hashing a
+        sheet chunk by chunk gives the same digest as hashing it in one piece.
+        Non-text cells (numbers and booleans from unformatted rendering) are
+        tagged so that 1 and "1" encode differently.
+        """
+        try:
+            return "".join(["\x1f".join(row) + "\x1e" for row in rows]).encode()
+        except TypeError:
+            return "".join([
+                "\x1f".join([value if isinstance(value, str) else f"\x00{value!r}" for value in row]) + "\x1e"
+                for row in rows
+            ]).encode()
+    
+    def _encode_each_row(self, rows: List[List[Any]]) -> List[bytes]:
+        """_encode_rows for every row on its own (joined, they give _encode_rows(rows))"""
+        try:
+            return [("\x1f".join(row) + "\x1e").encode() for row in rows]
+        except TypeError:
+            return [self._encode_rows([row]) for row in rows]
+    
+    def _row_digests(self, rows: List[List[Any]]) -> List[bytes]:
+        """Hash every row on its own; the digests are the delta fingerprints and feed ContentHash"""
+        blake2b = hashlib.blake2b
+        return [blake2b(encoded, digest_size=16).digest() for encoded in self._encode_each_row(rows)]
+    
+    def _trim_row(self, row: List[str], width: int) -> List[str]:
+        """Cut a row to width and drop trailing blanks, matching what a width-limited range returns"""
+        row = row[:width]
+        while row and row[-1] == '':
+            row = row[:-1]
+        return row
+    
+    def _tail_fingerprint(self, tail_rows) -> str:
+        """Fingerprint the last rows of a sheet (rows truncated to the header width)"""
+        hasher = self._new_content_hasher()
+        hasher.update(self._encode_rows(tail_rows))
+        return hasher.hexdigest()
+    
+    def _hash_blocks(self, state: Dict[str, Any], rows: List[List[str]], first_id: int) -> tuple:
+        """Hash rows, feed them to the content hash and record their block hashes.
+        
+        Returns the row digests and (start, end, block_index, block_hash) for each
+        block the rows touch, with start and end indexing into rows. A block that
+        began before these rows has no hash of its own (None).
+        """
+        digests = self._row_digests(rows)
+        blocks = []
+        start = 0
+        while start < len(rows):
+            offset = (first_id + start - 1) % self.block_rows
+            end = min(len(rows), start + self.block_rows - offset)
+            completed = state["hasher"].update(digests[start:end])
+            
+            block_index = (first_id + start - 1) // self.block_rows
+            block_hash = None
+            if not offset:
+                block_hash = (completed[0] if completed else ContentHash.block_hash(digests[start:end])).hex()
+            state["block_hashes"][block_index] = block_hash
+            blocks.append((start, end, block_index, block_hash))
+            start = end
+        return digests, blocks
+    
+    def _block_root(self, block_hashes: Dict[int, Optional[str]]) -> Optional[str]:
+        """Root hash over block hashes in block order (None while any block is missing or unknown)"""
+        if not block_hashes or not all(block_hashes.get(index) for index in range(len(block_hashes))):
+            return None
+        hasher = self._new_content_hasher()
+        for index in range(len(block_hashes)):
+            hasher.update(block_hashes[index].encode())
+        return hasher.hexdigest()
     
     def _calculate_content_hash_streaming(self, chunks) -> str:
-        """Calculate hash progressively for large datasets"""
-        hasher = hashlib.md5()
-        row_count = 0
-        
+        """Calculate hash progressively for large datasets, one chunk in memory at a time"""
+        hasher = ContentHash(self.block_rows)
         for chunk in chunks:
-            # For very large datasets, sample every 10th row after first 1000
-            for i, row in enumerate(chunk):
-                if row_count < 1000 or row_count % 10 == 0:
-                    hasher.update(json.dumps(row, sort_keys=True).encode())
-                row_count += 1
-        
+            hasher.update(self._row_digests(chunk))
         return hasher.hexdigest()
     
-    async def _fetch_sheet_chunked(self, sheets_service, spreadsheet_id: str, sheet_name: str, 
-                                  total_rows: int, chunk_size: int = 50000):
-        """Fetch sheet data in chunks for large datasets"""
-        chunks_fetched = 0
-        row_offset = 0
-        
-        # Determine actual data range (columns)
-        await self._wait_for_rate_limit()
-        self._record_api_call()
-        
-        # Get first row to determine column range
-        sample_range = f"'{sheet_name}'!1:1"
-        result = sheets_service.spreadsheets().values().get(
+    def _execute_in_thread(self, request) -> Dict[str, Any]:
+        """Execute a googleapiclient request on a worker thread with its own HTTP transport"""
+        if self.credentials is None:
+            return request.execute()
+        
+        # One keep-alive connection pool per worker thread, rebuilt if the credentials were reloaded
+        http = getattr(self._thread_local, 'http', None)
+        if http is None or http.credentials is not self.credentials:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return request.execute(http=http)
+    
+    async def _execute_request(self, request, timings: Optional[List[float]] = None) -> Dict[str, Any]:
+        """Rate-limit a Google API request, run it off the event loop, and retry transient failures.
+        
+        If timings is given, the duration of the successful attempt (without
+        rate-limit waits) is appended to it.
+        """
+        loop = asyncio.get_running_loop()
+        counter = _api_call_counter.get()
+        for attempt in itertools.count():
+            if counter is not None and counter["calls"] >= counter.get("limit", float("inf")):
+                raise CallBudgetExhausted(f"API call budget of {counter['limit']} calls is spent")
+            admitted_at = await self.rate_limiter.acquire()
+            await self.quota_ledger.acquire()
+            if counter is not None:
+                counter["calls"] += 1
+            started = time.monotonic()
+            try:
+                response = await loop.run_in_executor(self._executor, self._execute_in_thread, request)
+            except Exception as e:
+                retryable, rate_limited, retry_after = self._classify_api_error(e)
+                if rate_limited:
+                    self.rate_limiter.throttled(admitted_at)
+                if not retryable or attempt >= self.max_api_retries:
+                    raise
+                
+                # Full jitter, but never sooner than the server asked for
+                delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                logger.warning(f"API request failed ({e}); retry {attempt + 1}/{self.max_api_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            
+            self.rate_limiter.succeeded()
+            if timings is not None:
+                timings.append(time.monotonic() - started)
+            return response
+    
+    def _classify_api_error(self, error: Exception):
+        """Return (retryable, rate_limited, retry_after seconds or None) for a failed request"""
+        if isinstance(error, HttpError):
+            status = error.resp.status
+            reasons = set()
+            try:
+                details = json.loads(error.content.decode()).get('error', {})
+                reasons = {e.get('reason') for e in details.get('errors', [])}
+            except (ValueError, AttributeError):
+                pass
+            
+            rate_limited = status == 429 or (status == 403 and bool(reasons & RATE_LIMIT_REASONS))
+            retry_after = None
+            try:
+                retry_after = float(error.resp.get('retry-after'))
+            except (TypeError, ValueError):
+                pass
+            return rate_limited or status in RETRYABLE_STATUS_CODES, rate_limited, retry_after
+        
+        # Dropped connections and timeouts; DNS failures and other errors are not transient
+        if isinstance(error, (ConnectionError, TimeoutError, socket.timeout)):
+            return True, False, None
+        return False, False, None
+    
+    async def _get_spreadsheet_metadata(self, sheets_service, spreadsheet_id: str,
+                                        fields: str = SPREADSHEET_METADATA_FIELDS,
+                                        max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Fetch spreadsheet metadata limited to fields, through the shared metadata cache.
+        
+        max_age (seconds) defaults to metadata_cache_ttl_seconds; 0 forces a fresh
+        fetch, which still refreshes the cache for other callers.
+        """
+        if max_age is None:
+            max_age = self.metadata_cache_ttl_seconds
+        
+        cache_key = (spreadsheet_id, fields)
+        cached = _spreadsheet_metadata_cache.get(cache_key)
+        if cached and time.time() - cached[0] < max_age:
+            return cached[1]
+        
+        metadata = await self._execute_request(sheets_service.spreadsheets().get(
             spreadsheetId=spreadsheet_id,
-            range=sample_range
-        ).execute()
+            fields=fields
+        ))
+        _spreadsheet_metadata_cache[cache_key] = (time.time(), metadata)
+        return metadata
+    
+    async def _get_drive_version(self, spreadsheet_id: str) -> Optional[Dict[str, str]]:
+        """Drive modifiedTime and version of a spreadsheet, or None when Drive cannot be asked.
         
-        first_row = result.get('values', [[]])[0] if result.get('values') else []
-        if not first_row:
+        Needs the drive.metadata.readonly scope unless DRIVE_API_ENDPOINT points at
+        a stand-in; failures are logged and treated as "unknown".
+        """
+        if DRIVE_API_ENDPOINT is None and DRIVE_METADATA_SCOPE not in self.granted_scopes:
+            return None
+        
+        try:
+            if self._drive_service is None:
+                client_options = {"api_endpoint": DRIVE_API_ENDPOINT} if DRIVE_API_ENDPOINT else None
+                self._drive_service = build('drive', 'v3', credentials=self.credentials,
+                                            client_options=client_options)
+            return await self._execute_request(self._drive_service.files().get(
+                fileId=spreadsheet_id,
+                fields="modifiedTime,version",
+                supportsAllDrives=True
+            ))
+        except Exception as e:
+            logger.info(f"Drive version check unavailable for {spreadsheet_id}: {e}")
+            return None
+    
+    def _drive_version_unchanged(self, spreadsheet_id: str, drive_info: Dict[str, str]) -> bool:
+        """Whether every synced tab of a spreadsheet was verified at this Drive version"""
+        with self._get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT DISTINCT drive_version FROM _sheet_metadata WHERE spreadsheet_id = ?
+            """, (spreadsheet_id,))
+            versions = [row[0] for row in cursor.fetchall()]
+        return versions == [drive_info.get('version')] and versions[0] is not None
+    
+    def _record_drive_version(self, spreadsheet_id: str, drive_info: Dict[str, str]):
+        """Mark every synced tab of a spreadsheet as verified at this Drive version"""
+        with self._get_db_connection() as conn:
+            conn.execute("""
+                UPDATE _sheet_metadata SET drive_version = ?, drive_modified_time = ?
+                WHERE spreadsheet_id = ?
+            """, (drive_info.get('version'), drive_info.get('modifiedTime'), spreadsheet_id))
+            conn.commit()
+    
+    async def _report_progress(self, rows_expected: int = 0, rows_fetched: int = 0, rows_inserted: int = 0):
+        """Add to the row counters of the sync running in this context, if anyone is listening.
+        
+        Background jobs are saved every job_progress_interval seconds; foreground
+        calls with a progress token get an MCP progress notification per chunk.
+        """
+        progress = _current_progress.get()
+        if progress is None:
             return
         
-        # Calculate actual column range (A to last column with data)
-        last_col = self._number_to_column(len(first_row))
+        progress["rows_expected"] += rows_expected
+        progress["rows_fetched"] += rows_fetched
+        progress["rows_inserted"] += rows_inserted
+        if "job_id" in progress:
+            if time.time() - progress["updated_at"] >= self.job_progress_interval:
+                await self._save_job(progress)
+        elif rows_fetched or rows_inserted:
+            await self._send_progress_notification(progress)
+    
+    async def _send_progress_notification(self, progress: Dict[str, Any]):
+        """Notify the client of a foreground sync's progress (fetching and inserting each count once)"""
+        sheet = _current_sheet.get()
+        message = f"{progress['rows_fetched']} rows fetched, {progress['rows_inserted']} inserted"
+        if sheet:
+            message += f" (sheet '{sheet}')"
+        
+        # Progress must grow with every notification, so fetched and inserted rows both count
+        done = progress["rows_fetched"] + progress["rows_inserted"]
+        total = 2 * progress["rows_expected"] if progress["rows_expected"] else None
+        session, token = progress["session"], progress["progress_token"]
+        try:
+            try:
+                await session.send_progress_notification(token, done, total, message=message)
+            except TypeError:
+                # mcp releases before progress messages were added
+                await session.send_progress_notification(token, done, total)
+        except Exception as e:
+            logger.debug(f"Could not send progress notification: {e}")
+    
+    async def _save_job(self, job: Dict[str, Any]) -> bool:
+        """Write a job's current state to _sync_jobs (on the writer thread, between chunk commits)"""
+        job["updated_at"] = time.time()
+        row = [json.dumps(job[column]) if column in ("arguments", "errors", "result") else job[column]
+               for column in SYNC_JOB_COLUMNS]
+        try:
+            await self._run_db_write(self._write_job_row, row)
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save progress of job {job['job_id']}: {e}")
+            return False
+    
+    def _write_job_row(self, row: List[Any]):
+        with self._get_db_connection() as conn:
+            conn.execute(f"""
+                INSERT OR REPLACE INTO _sync_jobs ({", ".join(SYNC_JOB_COLUMNS)})
+                VALUES ({", ".join("?" * len(SYNC_JOB_COLUMNS))})
+            """, row)
+    
+    def _load_jobs(self, job_id: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Saved jobs, newest first; jobs running in this process report their live counters"""
+        with self._get_db_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            if job_id:
+                rows = conn.execute("SELECT * FROM _sync_jobs WHERE job_id = ?", (job_id,)).fetchall()
+            else:
+                rows = conn.execute("SELECT * FROM _sync_jobs ORDER BY started_at DESC LIMIT ?", (limit,)).fetchall()
+        
+        jobs = []
+        for row in rows:
+            job = _sync_jobs.get(row["job_id"])
+            if job is None:
+                job = dict(row)
+                for column in ("arguments", "errors", "result"):
+                    job[column] = json.loads(job[column]) if job[column] else None
+                # Running jobs are saved every few seconds; a silent one died with its server process
+                if job["status"] == "running" and time.time() - job["updated_at"] > self.job_stale_seconds:
+                    job["status"] = "interrupted"
+            jobs.append(job)
+        return jobs
+    
+    def _job_status(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Progress report for sync_status: counters plus rate and ETA"""
+        end = job["finished_at"] or time.time()
+        elapsed = max(end - job["started_at"], 0.001)
+        rate = job["rows_fetched"] / elapsed
+        status = {
+            "job_id": job["job_id"],
+            "tool": job["tool"],
+            "status": job["status"],
+            "arguments": job["arguments"],
+            "rows_expected": job["rows_expected"],
+            "rows_fetched": job["rows_fetched"],
+            "rows_inserted": job["rows_inserted"],
+            "rows_per_second": round(rate, 1),
+            "elapsed_seconds": round(elapsed, 1),
+            "errors": job["errors"] or []
+        }
+        if job["status"] == "running":
+            remaining = max(job["rows_expected"] - job["rows_fetched"], 0)
+            status["eta_seconds"] = round(remaining / rate, 1) if rate > 0 else None
+        else:
+            status["result"] = job["result"]
+        return status
+    
+    def _get_stale_tabs(self) -> Dict[tuple, List[str]]:
+        """Synced tabs older than cache_ttl_seconds, stalest first, grouped by how they were synced:
+        (spreadsheet_id, value_render, keep_formatted, max_rows)"""
+        with self._get_db_connection() as conn:
+            rows = conn.execute("""
+                SELECT spreadsheet_id, COALESCE(value_render, 'formatted'), COALESCE(keep_formatted, 0),
+                       COALESCE(max_rows, ?), sheet_name
+                FROM _sheet_metadata
+                WHERE sync_time < datetime('now', ?)
+                ORDER BY sync_time ASC
+            """, (MAX_ROWS_PER_SYNC, f"-{int(self.cache_ttl_seconds)} seconds")).fetchall()
+        
+        stale_tabs = {}
+        for spreadsheet_id, value_render, keep_formatted, max_rows, sheet_name in rows:
+            stale_tabs.setdefault((spreadsheet_id, value_render, bool(keep_formatted), max_rows), []).append(sheet_name)
+        return stale_tabs
+    
+    def _get_synced_tab_names(self, spreadsheet_id: str) -> set:
+        """Names of every synced tab of a spreadsheet"""
+        with self._get_db_connection() as conn:
+            rows = conn.execute("SELECT sheet_name FROM _sheet_metadata WHERE spreadsheet_id = ?",
+                                (spreadsheet_id,)).fetchall()
+        return {row[0] for row in rows}
+    
+    def _mark_tabs_fresh(self, spreadsheet_id: str, sheet_names: List[str]):
+        """Reset the sync time of tabs verified to be unchanged"""
+        with self._get_db_connection() as conn:
+            conn.execute(f"""
+                UPDATE _sheet_metadata SET sync_time = CURRENT_TIMESTAMP
+                WHERE spreadsheet_id = ? AND sheet_name IN ({", ".join("?" * len(sheet_names))})
+            """, (spreadsheet_id, *sheet_names))
+            conn.commit()
+    
+    async def _get_sheet_properties(self, sheets_service, spreadsheet_id: str, sheet_name: str) -> Dict[str, Any]:
+        """Properties of one tab, from the cached spreadsheet metadata"""
+        metadata = await self._get_spreadsheet_metadata(sheets_service, spreadsheet_id)
+        for sheet in metadata.get('sheets', []):
+            if sheet['properties']['title'] == sheet_name:
+                return sheet['properties']
+        raise ValueError(f"Sheet '{sheet_name}' not found in spreadsheet")
+    
+    async def _fetch_sheet_chunked(self, sheets_service, spreadsheet_id: str, sheet_name: str, 
+                                  total_rows: int, chunk_size: int = 50000, header_probe=None,
+                                  start_row: int = 1, last_col: Optional[str] = None,
+                                  value_render: str = "formatted", row_limit: Optional[int] = None):
+        """Fetch sheet data in chunks for large datasets.
+        
+        Keeps up to max_inflight_requests range requests outstanding and yields
+        chunks in row order, covering sheet rows start_row..total_rows. When
+        start_row is 1 the first chunk includes the header row. Empty rows trimmed
+        from the end of a chunk are restored once later data arrives, so row
+        positions always match the sheet. header_probe, if given, is an awaitable
+        for the already-batched first-row values; last_col skips the probe entirely.
+        
+        Requests are sized by cells: sheets wider than max_columns_per_request are
+        split into column blocks that are fetched side by side and stitched back
+        into rows, and each request covers at most max_cells_per_request cells.
+        chunk_size is only the first request's row count: later requests are
+        resized from the observed response size and latency (see _next_chunk_rows).
+        
+        total_rows may be an estimate: rows after it, up to row_limit, are fetched
+        one request at a time until a request comes back empty.
+        """
+        if last_col is None:
+            # Get first row to determine column range
+            if header_probe is not None:
+                probe_values = await header_probe
+            else:
+                sample_range = f"'{sheet_name}'!1:1"
+                result = await self._execute_request(sheets_service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=sample_range,
+                    **VALUE_RENDER_OPTIONS[value_render]
+                ))
+                probe_values = result.get('values', [])
+            
+            first_row = probe_values[0] if probe_values else []
+            if not first_row:
+                return
+            
+            # Calculate actual column range (A to last column with data)
+            width = len(first_row)
+        else:
+            width = self._column_to_number(last_col)
+        
+        column_blocks = self._plan_column_blocks(width)
+        block_width = max(last - first + 1 for first, last in column_blocks)
+        max_rows_per_request = max(1, self.max_cells_per_request // block_width)
+        rows_per_request = min(chunk_size, max_rows_per_request)
+        
+        row_limit = max(row_limit or total_rows, total_rows)
+        row_offset = start_row - 1
+        pending = deque()  # (chunk_start, end_row, block tasks, timings) in submission order
+        empty_rows = 0  # Trimmed empty rows not yet yielded
+        measured = False  # The pipeline only fills once the first response has sized the ranges
         
-        while row_offset < total_rows:
-            # Calculate chunk range
-            start_row = row_offset + 1
-            end_row = min(row_offset + chunk_size, total_rows)
-            range_name = f"'{sheet_name}'!A{start_row}:{last_col}{end_row}"
+        try:
+            while row_offset < row_limit or pending:
+                # Keep the pipeline full (at least one row block, however many column blocks it has);
+                # past total_rows, only one request is outstanding
+                while row_offset < row_limit and (not pending or (
+                        measured and row_offset < total_rows
+                        and (len(pending) + 1) * len(column_blocks) <= self.max_inflight_requests)):
+                    chunk_start = row_offset + 1
+                    end_row = min(row_offset + rows_per_request, total_rows if row_offset < total_rows else row_limit)
+                    
+                    tasks = []
+                    timings = []
+                    for first_col, last_block_col in column_blocks:
+                        range_name = (f"'{sheet_name}'!{self._number_to_column(first_col)}{chunk_start}:"
+                                      f"{self._number_to_column(last_block_col)}{end_row}")
+                        request = sheets_service.spreadsheets().values().get(
+                            spreadsheetId=spreadsheet_id,
+                            range=range_name,
+                            **VALUE_RENDER_OPTIONS[value_render]
+                        )
+                        tasks.append(asyncio.ensure_future(self._execute_request(request, timings)))
+                    pending.append((chunk_start, end_row, tasks, timings))
+                    row_offset = end_row
+                
+                chunk_start, end_row, tasks, timings = pending.popleft()
+                try:
+                    block_results = await asyncio.gather(*tasks)
+                except BaseException:
+                    for task in tasks:
+                        task.cancel()
+                    raise
+                
+                block_values = [block_result.get('values', []) for block_result in block_results]
+                if len(column_blocks) == 1:
+                    chunk_data = block_values[0]
+                else:
+                    chunk_data = self._stitch_column_blocks(block_values, column_blocks)
+                
+                # Size the next ranges from this one (column blocks run in parallel, so per block)
+                rows_per_request = self._next_chunk_rows(
+                    end_row - chunk_start + 1,
+                    self._estimate_rows_bytes(chunk_data) / len(column_blocks),
+                    max(timings, default=0.0),
+                    max_rows_per_request
+                )
+                measured = True
+                
+                if not chunk_data and chunk_start > total_rows:
+                    break  # A whole range past the estimate is empty: the data has ended
+                
+                if chunk_data:
+                    yield [[] for _ in range(empty_rows)] + chunk_data if empty_rows else chunk_data
+                    empty_rows = 0
+                empty_rows += (end_row - chunk_start + 1) - len(chunk_data)
+                
+                if end_row <= total_rows:
+                    progress = (end_row / total_rows) * 100
+                    logger.info(f"Fetched {end_row}/{total_rows} rows ({progress:.1f}%)")
+                else:
+                    logger.info(f"Fetched {end_row} rows ({end_row - total_rows} past the estimated {total_rows})")
+        finally:
+            # Consumer stopped early or a request failed - drop outstanding requests
+            for _, _, tasks, _ in pending:
+                for task in tasks:
+                    task.cancel()
+    
+    def _next_chunk_rows(self, rows: int, response_bytes: float, seconds: float, max_rows: int) -> int:
+        """Row count for the next range request, aiming at chunk_target_bytes and chunk_target_seconds.
+        
+        Scales the last request's row count by whichever target it missed most.
+        Growth is limited to chunk_max_growth per request; shrinking is not, so an
+        oversized or slow response is corrected at once.
+        """
+        scale = self.chunk_max_growth
+        if response_bytes > 0:
+            scale = min(scale, self.chunk_target_bytes / response_bytes)
+        if seconds > 0:
+            scale = min(scale, self.chunk_target_seconds / seconds)
+        return max(1, min(max_rows, max(self.chunk_min_rows, int(rows * scale))))
+    
+    def _estimate_rows_bytes(self, rows: List[List[Any]], sample_size: int = 200) -> float:
+        """Approximate JSON size of rows, from an evenly spaced sample"""
+        if not rows:
+            return 0.0
+        step = max(1, len(rows) // sample_size)
+        sample = rows[::step]
+        # Each cell adds quotes and a comma; each row adds brackets and a comma
+        sample_bytes = sum(sum(len(str(value)) + 3 for value in row) + 3 for row in sample)
+        return sample_bytes * len(rows) / len(sample)
+    
+    def _plan_column_blocks(self, width: int) -> List[tuple]:
+        """Split columns 1..width into (first, last) blocks of at most max_columns_per_request"""
+        return [
+            (first, min(first + self.max_columns_per_request - 1, width))
+            for first in range(1, max(width, 1) + 1, self.max_columns_per_request)
+        ]
+    
+    def _stitch_column_blocks(self, block_values: List[List[List[Any]]], column_blocks: List[tuple]) -> List[List[Any]]:
+        """Join the rows of side-by-side column blocks, trimmed like a single full-width range"""
+        rows = []
+        for parts in itertools.zip_longest(*block_values, fillvalue=[]):
+            row = []
+            for part, (first, last) in zip(parts, column_blocks):
+                row.extend(part)
+                row.extend([''] * (last - first + 1 - len(part)))
+            while row and row[-1] == '':
+                row.pop()
+            rows.append(row)
+        return rows
+    
+    def _needs_chunking(self, rows: int, columns: int) -> bool:
+        """Whether a rows x columns range is too large for a single values request"""
+        return rows > self.chunking_threshold_rows or rows * columns > self.max_cells_per_request
+    
+    async def _fetch_sheet_values(self, sheets_service, spreadsheet_id: str, sheet_name: str,
+                                  total_rows: int, total_cols: int, prefetched=None,
+                                  value_render: str = "formatted", row_limit: Optional[int] = None):
+        """Yield a sheet's rows as chunks, using chunked fetching for large sheets.
+        
+        total_cols is the grid width, used to size requests by cells.
+        prefetched is an optional awaitable from _prefetch_tabs holding this tab's
+        batched values (the whole tab when small, the header row when chunked),
+        fetched with the same value_render. row_limit, if larger than total_rows,
+        makes total_rows an estimate (see _estimate_row_extent): chunking is decided
+        on row_limit, and chunked fetches carry on past the estimate.
+        """
+        row_limit = max(row_limit or total_rows, total_rows)
+        if self._needs_chunking(row_limit, total_cols):
+            chunk_size = 50000 if total_rows > 100000 else 10000
+            logger.info(f"Using chunked fetching for {sheet_name}: {total_rows} rows")
             
-            # Fetch chunk with rate limiting
-            await self._wait_for_rate_limit()
-            self._record_api_call()
+            async for chunk in self._fetch_sheet_chunked(
+                sheets_service, spreadsheet_id, sheet_name, total_rows, chunk_size, header_probe=prefetched,
+                value_render=value_render, row_limit=row_limit
+            ):
+                yield chunk
+        else:
+            if prefetched is not None:
+                values = await prefetched
+            else:
+                # Single fetch for smaller sheets
+                range_name = f"'{sheet_name}'!A1:{self._number_to_column(max(total_cols, 1))}{row_limit}"
+                result = await self._execute_request(sheets_service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_name,
+                    **VALUE_RENDER_OPTIONS[value_render]
+                ))
+                values = result.get('values', [])
             
-            chunk_result = sheets_service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name
-            ).execute()
+            if values:
+                yield values
+    
+    async def _with_formatted_columns(self, chunks, formatted_chunks):
+        """Add formatted-text companion columns to unformatted chunks.
+        
+        Both streams cover the same rows, but each sizes its own ranges, so
+        formatted rows are matched to unformatted ones by row position rather
+        than chunk by chunk. Columns holding numbers in the first chunk get a
+        companion column named <header>_formatted with the text shown in the
+        sheet (e.g. "$1,234.50").
+        """
+        companions = None
+        width = 0
+        text_rows = []  # Formatted data rows fetched but not yet matched, in row order
+        text_header = True  # The formatted stream's header row is still to be dropped
+        text_done = False
+        
+        try:
+            async for chunk in chunks:
+                header, rows = [], chunk
+                if companions is None:
+                    headers = chunk[0]
+                    width = len(headers)
+                    companions = [
+                        index for index in range(width)
+                        if any(index < len(row) and isinstance(row[index], (int, float))
+                               and not isinstance(row[index], bool) for row in chunk[1:])
+                    ]
+                    header = [headers + [f"{headers[index]}_formatted" for index in companions]]
+                    rows = chunk[1:]
+                    if not companions:
+                        # Nothing numeric to keep text for - stop fetching the formatted copy
+                        await formatted_chunks.aclose()
+                
+                if companions:
+                    while len(text_rows) < len(rows) and not text_done:
+                        try:
+                            text_chunk = await formatted_chunks.__anext__()
+                        except StopAsyncIteration:
+                            # Trailing empty rows are trimmed from the end of the sheet
+                            text_done = True
+                            break
+                        text_rows.extend(text_chunk[1:] if text_header else text_chunk)
+                        text_header = False
+                    
+                    matched = text_rows[:len(rows)]
+                    del text_rows[:len(rows)]
+                    matched.extend([] for _ in range(len(rows) - len(matched)))
+                    rows = [
+                        row[:width] + [''] * (width - len(row)) +
+                        [text_row[index] if index < len(text_row) else '' for index in companions]
+                        for row, text_row in zip(rows, matched)
+                    ]
+                yield header + rows
+        finally:
+            await formatted_chunks.aclose()
+    
+    def _plan_batch_gets(self, range_specs: List[tuple]) -> List[List[str]]:
+        """Group (range, estimated_bytes) pairs into batchGet calls within the response byte budget"""
+        groups = []
+        current = []
+        current_bytes = 0
+        
+        for range_name, estimated_bytes in range_specs:
+            if current and (current_bytes + estimated_bytes > self.batch_get_byte_budget
+                            or len(current) >= self.batch_get_max_ranges):
+                groups.append(current)
+                current = []
+                current_bytes = 0
+            current.append(range_name)
+            current_bytes += estimated_bytes
+        
+        if current:
+            groups.append(current)
+        return groups
+    
+    async def _batch_get_values(self, sheets_service, spreadsheet_id: str, ranges: List[str],
+                                value_render: str = "formatted") -> List[List[List[str]]]:
+        """Fetch several ranges with one batchGet call, returning values in request order"""
+        result = await self._execute_request(sheets_service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            **VALUE_RENDER_OPTIONS[value_render]
+        ))
+        return [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
+    
+    async def _batched_range(self, batch_task: asyncio.Future, index: int) -> List[List[str]]:
+        """Await a batchGet call and pick out one of its ranges"""
+        return (await batch_task)[index]
+    
+    def _prefetch_tabs(self, sheets_service, spreadsheet_id: str, plans: List[Dict[str, Any]],
+                       value_render: str = "formatted") -> Dict[str, Any]:
+        """Start batchGet calls covering every small tab and the header probe of every chunked tab
+        (except tabs with a checkpoint to resume from, which check their header themselves).
+        
+        Returns sheet title -> awaitable of that tab's values, for _fetch_sheet_values.
+        """
+        range_specs = []
+        range_owner = {}
+        
+        for plan in plans:
+            if plan["entry"] is not None or plan["row_limit"] <= 0 or plan["checkpointed"]:
+                continue
             
-            chunk_data = chunk_result.get('values', [])
-            if chunk_data:
-                # Include headers in first chunk
-                if chunks_fetched == 0 and row_offset > 0:
-                    chunk_data = [first_row] + chunk_data
-                yield chunk_data
+            sheet_title = plan["sheet_title"]
+            columns = plan["grid_size"][1] or 1
+            if self._needs_chunking(plan["row_limit"], columns):
+                range_name = f"'{sheet_title}'!1:1"
+                estimated_bytes = columns * self.estimated_bytes_per_cell
+            else:
+                range_name = f"'{sheet_title}'!A1:{self._number_to_column(columns)}{plan['row_limit']}"
+                estimated_bytes = plan["row_limit"] * columns * self.estimated_bytes_per_cell
             
-            chunks_fetched += 1
-            row_offset = end_row
+            range_specs.append((range_name, estimated_bytes))
+            range_owner[range_name] = sheet_title
+        
+        prefetched = {}
+        for group in self._plan_batch_gets(range_specs):
+            batch_task = asyncio.ensure_future(
+                self._batch_get_values(sheets_service, spreadsheet_id, group, value_render)
+            )
+            for index, range_name in enumerate(group):
+                prefetched[range_owner[range_name]] = self._batched_range(batch_task, index)
+        
+        return prefetched
+    
+    async def _run_db_write(self, func, *args):
+        """Run a database operation on the single writer thread.
+        
+        Concurrent tab syncs share one connection, and funnelling every statement
+        through one thread keeps them serialized without blocking the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_writer, func, *args)
+    
+    async def _stream_into_table(self, cursor: sqlite3.Cursor, safe_name: str, chunks,
+                                 sync_mode: str = "full", append_from: Optional[Dict[str, Any]] = None,
+                                 value_render: str = "formatted", checkpoint: Optional[Dict[str, Any]] = None,
+                                 resume_from: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Load a sheet chunk by chunk as the chunks arrive, one chunk in memory at a time.
+        
+        sync_mode is "full", "delta" or "append" (see _load_chunk). append_from
+        continues a previous sync (see _get_append_state) and resume_from an
+        interrupted one (see _get_resume_state), with the chunks holding only the
+        rows after it. checkpoint makes each committed chunk resumable (see
+        _record_checkpoint). value_render is the rendering the chunks were fetched
+        with. Returns None if the sheet has no data.
+        """
+        state = self._new_ingest_state(safe_name, sync_mode)
+        state["value_render"] = value_render
+        state["checkpoint"] = checkpoint
+        
+        if resume_from is not None:
+            # Private tables are kept as they are; continue the hash of the loaded rows
+            state["hasher"] = ContentHash(self.block_rows, resume_from["prefix_hash"])
+            state["tail"].extend(resume_from["tail"])
+            state["block_hashes"].update(
+                (int(index), block_hash) for index, block_hash in resume_from.get("block_hashes", {}).items()
+            )
+            state.update({key: resume_from[key] for key in (
+                "mode", "headers", "safe_headers", "column_types", "row_count", "rows_changed",
+                "record_fingerprints"
+            )})
+            await self._run_db_write(self._reopen_ingest_tables, cursor, state)
+        
+        if append_from is not None:
+            # Continue the previous content hash, so it matches hashing the whole sheet
+            state["hasher"] = ContentHash(self.block_rows, append_from["hash_state"])
+            state["tail"].extend(append_from["tail_rows"])
+            state.update(headers=append_from["headers"], safe_headers=append_from["safe_headers"],
+                         column_types=append_from["column_types"], row_count=append_from["row_count"])
+            await self._run_db_write(self._create_ingest_tables, cursor, state)
+        
+        async for chunk in chunks:
+            await self._report_progress(rows_fetched=len(chunk))
+            await self._run_db_write(self._ingest_chunk, cursor, state, chunk)
+            await self._report_progress(rows_inserted=len(chunk))
+        
+        # Load the rows held back for the last block
+        await self._run_db_write(self._ingest_chunk, cursor, state, [], True)
+        
+        if state["headers"] is None:
+            return None
+        
+        return {
+            "mode": state["mode"],
+            "headers": state["headers"],
+            "safe_headers": state["safe_headers"],
+            "column_types": state["column_types"],
+            "row_count": state["row_count"],
+            "rows_changed": state["rows_changed"],
+            "record_fingerprints": state["record_fingerprints"],
+            "tail_row_count": len(state["tail"]),
+            "tail_fingerprint": self._tail_fingerprint(state["tail"]),
+            "content_hash": state["hasher"].hexdigest(),
+            "hash_state": state["hasher"].state(),
+            "block_hashes": state["block_hashes"],
+            "value_render": value_render
+        }
+    
+    def _new_ingest_state(self, safe_name: str, sync_mode: str = "full") -> Dict[str, Any]:
+        """Create the mutable state threaded through _ingest_chunk calls"""
+        return {
+            "table_name": safe_name,
+            "mode": sync_mode,
+            "value_render": "formatted",
+            "record_fingerprints": sync_mode in ("delta", "append"),
+            "hasher": ContentHash(self.block_rows),
+            "headers": None,
+            "safe_headers": [],
+            "column_types": [],
+            "insert_sql": "",
+            "row_count": 0,
+            "rows_changed": 0,
+            "tail": deque(maxlen=self.append_tail_rows),
+            "pending": [],  # Rows of a block that continues in the next chunk
+            "block_hashes": {},
+            "stored_blocks": {},  # Block hashes of the live table (delta mode)
+            "checkpoint": None
+        }
+    
+    def _ingest_chunk(self, cursor: sqlite3.Cursor, state: Dict[str, Any], chunk: List[List[str]],
+                      final: bool = False):
+        """Load one chunk (writer thread), committed together with its checkpoint.
+        
+        A chunk that fails part-way is rolled back before the error propagates, so
+        the shared connection never commits a partial chunk later on.
+        """
+        try:
+            self._load_chunk(cursor, state, chunk, final)
+        except Exception:
+            cursor.connection.rollback()
+            raise
+    
+    def _load_chunk(self, cursor: sqlite3.Cursor, state: Dict[str, Any], chunk: List[List[str]],
+                    final: bool = False):
+        """Hash and load one chunk; the first chunk also creates the target tables.
+        
+        Full mode loads every row into _staging_<name>. Delta mode skips blocks
+        whose hash matches _block_hashes and loads only the rows of the other
+        blocks whose fingerprint differs from _row_fingerprints into _delta_<name>.
+        Delta falls back to full when the live table cannot take the rows in place
+        (see _can_apply_delta), and full switches to delta when it can. Append mode
+        loads every row into _delta_<name>.
+        
+        Rows are loaded in whole blocks: the rows of a block that continues in the
+        next chunk are held back until then, or until the final call.
+        """
+        if state["headers"] is None:
+            if not chunk:
+                return
+            headers = chunk[0]
+            safe_headers = [re.sub(r'[^a-zA-Z0-9_]', '_', str(h).lower()) for h in headers]
+            state["hasher"].update(self._row_digests([headers]))
+            state.update(headers=headers, safe_headers=safe_headers)
+            rows = chunk[1:]
+            
+            if state["mode"] in ("full", "delta") and self._can_apply_delta(
+                    cursor, state["table_name"], safe_headers, state["value_render"]):
+                state["stored_blocks"] = self._load_block_hashes(cursor, state["table_name"])
+                if state["mode"] == "full" and state["stored_blocks"]:
+                    # The live table has the same columns: rewrite only the blocks that changed
+                    state.update(mode="delta", record_fingerprints=True)
+            elif state["mode"] == "delta":
+                state["mode"] = "full"
+            
+            if state["mode"] == "delta":
+                # Start from the live table's types so unchanged rows keep their representation
+                state["column_types"] = self._table_column_types(cursor, state["table_name"])
+                self._create_ingest_tables(cursor, state)
+                self._widen_column_types(cursor, state, rows)
+            else:
+                state["column_types"] = [
+                    column_type or "TEXT" for column_type in self._infer_column_types(rows, len(headers))
+                ]
+                self._create_ingest_tables(cursor, state)
+        else:
+            rows = chunk
+            # Widen columns whose new values do not fit the types chosen so far
+            self._widen_column_types(cursor, state, rows)
+        
+        rows = state["pending"] + rows
+        whole = len(rows) if final else max(len(rows) - (state["row_count"] + len(rows)) % self.block_rows, 0)
+        state["pending"] = rows[whole:]
+        rows = rows[:whole]
+        if not rows:
+            cursor.connection.commit()
+            return
+        
+        width = len(state["headers"])
+        first_id = state["row_count"] + 1
+        digests, blocks = self._hash_blocks(state, rows, first_id)
+        
+        # Remember the last rows for append-mode tail verification
+        state["tail"].extend(self._trim_row(row, width) for row in rows[-self.append_tail_rows:])
+        
+        if state["mode"] in ("delta", "append"):
+            # Skip blocks whose hash is unchanged; in the others keep only rows whose fingerprint
+            # differs from the last sync (appended rows are all new)
+            changed = []
+            for start, end, block_index, block_hash in blocks:
+                if block_hash is not None and state["stored_blocks"].get(block_index) == block_hash:
+                    continue
+                
+                stored = {}
+                if state["mode"] == "delta":
+                    cursor.execute("""
+                        SELECT row_id, fingerprint FROM _row_fingerprints
+                        WHERE table_name = ? AND row_id BETWEEN ? AND ?
+                    """, (state["table_name"], first_id + start, first_id + end - 1))
+                    stored = dict(cursor.fetchall())
+                
+                changed.extend(
+                    (row_id, digest.hex(), row)
+                    for row_id, (row, digest) in enumerate(zip(rows[start:end], digests[start:end]), first_id + start)
+                    if stored.get(row_id) != digest.hex()
+                )
+            cursor.executemany(state["insert_sql"], (
+                [row_id, fingerprint] + self._typed_row(row, width, state["column_types"])
+                for row_id, fingerprint, row in changed
+            ))
+            state["rows_changed"] += len(changed)
+        else:
+            cursor.executemany(state["insert_sql"], (
+                [row_id] + self._typed_row(row, width, state["column_types"])
+                for row_id, row in enumerate(rows, first_id)
+            ))
+            if state["record_fingerprints"]:
+                cursor.executemany(
+                    f"INSERT INTO _staging_{state['table_name']}_fp VALUES (?, ?)",
+                    enumerate((digest.hex() for digest in digests), first_id)
+                )
+            state["rows_changed"] += len(rows)
+        
+        state["row_count"] += len(rows)
+        if state["checkpoint"] is not None:
+            self._record_checkpoint(cursor, state, first_id)
+        
+        # Staging tables are private, so each chunk can be committed on its own
+        cursor.connection.commit()
+        
+        # Log progress for large datasets
+        if state["row_count"] > 10000:
+            logger.info(f"Loaded {state['row_count']} rows for {state['table_name']} ({state['mode']})")
+    
+    def _can_apply_delta(self, cursor: sqlite3.Cursor, table_name: str, safe_headers: List[str],
+                         value_render: str = "formatted") -> bool:
+        """Delta sync needs the live table with identical columns, the same value rendering
+        and fingerprints or block hashes from a previous sync"""
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        live_columns = [column[1] for column in cursor.fetchall()]
+        if live_columns != ['row_id'] + safe_headers:
+            return False
+        
+        cursor.execute("SELECT value_render FROM _sheet_metadata WHERE table_name = ?", (table_name,))
+        result = cursor.fetchone()
+        if (result and result[0] or "formatted") != value_render:
+            return False
+        
+        cursor.execute("SELECT 1 FROM _row_fingerprints WHERE table_name = ? LIMIT 1", (table_name,))
+        if cursor.fetchone():
+            return True
+        cursor.execute("SELECT 1 FROM _block_hashes WHERE table_name = ? LIMIT 1", (table_name,))
+        return cursor.fetchone() is not None
+    
+    def _load_block_hashes(self, cursor: sqlite3.Cursor, table_name: str) -> Dict[int, str]:
+        """Block hashes of the live table, or none if they no longer match the recorded root"""
+        cursor.execute("SELECT block_index, block_hash FROM _block_hashes WHERE table_name = ?", (table_name,))
+        block_hashes = dict(cursor.fetchall())
+        
+        cursor.execute("SELECT block_root FROM _sheet_metadata WHERE table_name = ?", (table_name,))
+        result = cursor.fetchone()
+        if result and result[0] and result[0] != self._block_root(block_hashes):
+            return {}
+        return block_hashes
+    
+    def _store_block_hashes(self, cursor: sqlite3.Cursor, safe_name: str, block_hashes: Dict[int, Optional[str]],
+                            replace: bool = True):
+        """Record the block hashes of a published ingest and their root (the caller commits).
+        
+        replace drops every previously stored block first (the ingest covered the
+        whole sheet); otherwise only the given blocks change. Unknown hashes (None)
+        remove the stored ones.
+        """
+        if replace:
+            cursor.execute("DELETE FROM _block_hashes WHERE table_name = ?", (safe_name,))
+        cursor.executemany("INSERT OR REPLACE INTO _block_hashes (table_name, block_index, block_hash) VALUES (?, ?, ?)",
+                           [(safe_name, index, block_hash) for index, block_hash in block_hashes.items() if block_hash])
+        cursor.executemany("DELETE FROM _block_hashes WHERE table_name = ? AND block_index = ?",
+                           [(safe_name, index) for index, block_hash in block_hashes.items() if not block_hash])
+        
+        cursor.execute("SELECT block_index, block_hash FROM _block_hashes WHERE table_name = ?", (safe_name,))
+        cursor.execute("UPDATE _sheet_metadata SET block_root = ? WHERE table_name = ?",
+                       (self._block_root(dict(cursor.fetchall())), safe_name))
+    
+    def _create_ingest_tables(self, cursor: sqlite3.Cursor, state: Dict[str, Any]):
+        """Create the staging (full) or delta table for an ingest and its insert statement"""
+        safe_name = state["table_name"]
+        column_defs = ', '.join([f"{h} {t}" for h, t in zip(state["safe_headers"], state["column_types"])])
+        placeholders = ', '.join(['?' for _ in range(len(state["headers"]) + 1)])
+        
+        # A new ingest replaces whatever an interrupted one left behind
+        cursor.execute("DELETE FROM _sync_checkpoints WHERE table_name = ?", (safe_name,))
+        
+        if state["mode"] in ("delta", "append"):
+            cursor.execute(f"DROP TABLE IF EXISTS _delta_{safe_name}")
+            cursor.execute(f"CREATE TABLE _delta_{safe_name} (row_id INTEGER PRIMARY KEY, _fingerprint TEXT, {column_defs})")
+            state["insert_sql"] = f"INSERT INTO _delta_{safe_name} VALUES (?, {placeholders})"
+        else:
+            cursor.execute(f"DROP TABLE IF EXISTS _staging_{safe_name}")
+            cursor.execute(f"CREATE TABLE _staging_{safe_name} (row_id INTEGER PRIMARY KEY, {column_defs})")
+            state["insert_sql"] = f"INSERT INTO _staging_{safe_name} VALUES ({placeholders})"
             
-            # Progress callback placeholder
-            progress = (row_offset / total_rows) * 100
-            logger.info(f"Fetched {row_offset}/{total_rows} rows ({progress:.1f}%)")
+            if state["record_fingerprints"]:
+                cursor.execute(f"DROP TABLE IF EXISTS _staging_{safe_name}_fp")
+                cursor.execute(f"CREATE TABLE _staging_{safe_name}_fp (row_id INTEGER PRIMARY KEY, fingerprint TEXT)")
+        
+        # Release the write lock now; an append ingest only sees its first chunk after a network fetch
+        cursor.connection.commit()
+    
+    def _reopen_ingest_tables(self, cursor: sqlite3.Cursor, state: Dict[str, Any]):
+        """Continue loading the private tables of a checkpointed ingest (writer thread).
+        
+        Rows past the checkpoint (left by a chunk that was not rolled back) are removed first.
+        """
+        safe_name = state["table_name"]
+        placeholders = ', '.join(['?' for _ in range(len(state["headers"]) + 1)])
+        
+        if state["mode"] in ("delta", "append"):
+            tables = [f"_delta_{safe_name}"]
+            state["insert_sql"] = f"INSERT INTO _delta_{safe_name} VALUES (?, {placeholders})"
+            state["stored_blocks"] = self._load_block_hashes(cursor, safe_name)
+        else:
+            tables = [f"_staging_{safe_name}"]
+            if state["record_fingerprints"]:
+                tables.append(f"_staging_{safe_name}_fp")
+            state["insert_sql"] = f"INSERT INTO _staging_{safe_name} VALUES ({placeholders})"
+        
+        for table in tables:
+            cursor.execute(f"DELETE FROM {table} WHERE row_id > ?", (state["row_count"],))
+        cursor.connection.commit()
+    
+    def _record_checkpoint(self, cursor: sqlite3.Cursor, state: Dict[str, Any], first_id: int):
+        """Record a chunk in _sync_checkpoints, in the same transaction as its rows (writer thread)"""
+        checkpoint = state["checkpoint"]
+        resume_state = {
+            "mode": state["mode"],
+            "headers": state["headers"],
+            "safe_headers": state["safe_headers"],
+            "column_types": state["column_types"],
+            "row_count": state["row_count"],
+            "rows_changed": state["rows_changed"],
+            "record_fingerprints": state["record_fingerprints"],
+            "tail": list(state["tail"]),
+            "block_hashes": state["block_hashes"]
+        }
+        # Sheet rows: the header is row 1, so data row n is sheet row n + 1
+        cursor.execute("""
+            INSERT OR REPLACE INTO _sync_checkpoints
+            (table_name, start_row, end_row, prefix_hash, spreadsheet_id, sheet_name, sync_mode, value_render,
+             grid_row_count, grid_column_count, state, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (state["table_name"], first_id + 1, state["row_count"] + 1, state["hasher"].state(),
+              checkpoint["spreadsheet_id"], checkpoint["sheet_name"], checkpoint["sync_mode"],
+              state["value_render"], checkpoint["grid_size"][0], checkpoint["grid_size"][1],
+              json.dumps(resume_state), time.time()))
+    
+    def _has_checkpoint(self, cursor: sqlite3.Cursor, safe_name: str) -> bool:
+        """Whether an interrupted ingest of safe_name left a checkpoint (writer thread)"""
+        cursor.execute("SELECT 1 FROM _sync_checkpoints WHERE table_name = ? LIMIT 1", (safe_name,))
+        return cursor.fetchone() is not None
+    
+    def _load_checkpoint(self, cursor: sqlite3.Cursor, safe_name: str) -> Optional[Dict[str, Any]]:
+        """The last committed chunk of an interrupted ingest whose private tables still exist (writer thread)"""
+        cursor.execute("""
+            SELECT prefix_hash, spreadsheet_id, sheet_name, sync_mode, value_render,
+                   grid_row_count, grid_column_count, state, created_at
+            FROM _sync_checkpoints WHERE table_name = ?
+            ORDER BY end_row DESC LIMIT 1
+        """, (safe_name,))
+        result = cursor.fetchone()
+        if not result:
+            return None
+        
+        prefix_hash, spreadsheet_id, sheet_name, sync_mode, value_render, grid_rows, grid_cols, state_json, created_at = result
+        if ":" not in (prefix_hash or ""):
+            return None  # Written before checkpoints held a ContentHash state
+        state = json.loads(state_json)
+        table = f"_delta_{safe_name}" if state["mode"] in ("delta", "append") else f"_staging_{safe_name}"
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+        if not cursor.fetchone():
+            return None
+        
+        state.update(prefix_hash=prefix_hash, spreadsheet_id=spreadsheet_id, sheet_name=sheet_name,
+                     sync_mode=sync_mode, value_render=value_render, grid_size=(grid_rows, grid_cols),
+                     created_at=created_at)
+        return state
+    
+    def _drop_staging_tables(self, cursor: sqlite3.Cursor, safe_name: str):
+        """Remove any private tables (and checkpoints) left by an ingest of safe_name"""
+        for table in (f"_staging_{safe_name}", f"_staging_{safe_name}_fp", f"_delta_{safe_name}"):
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute("DELETE FROM _sync_checkpoints WHERE table_name = ?", (safe_name,))
+        cursor.connection.commit()
+    
+    def _value_type(self, value) -> str:
+        """Narrowest column type that can hold one non-empty cell value"""
+        if isinstance(value, bool) or value in ("TRUE", "FALSE"):
+            return "BOOLEAN"
+        if isinstance(value, int):
+            return "INTEGER"
+        if isinstance(value, float):
+            return "REAL"
+        if not isinstance(value, str):
+            return "TEXT"
+        if INTEGER_PATTERN.fullmatch(value) and str(int(value)) == value:
+            return "INTEGER"
+        if REAL_PATTERN.fullmatch(value) and self._real_text(float(value)) == value:
+            return "REAL"
+        if DATE_PATTERN.fullmatch(value):
+            return "DATE"
+        return "TEXT"
+    
+    def _real_text(self, value) -> str:
+        """Text of a stored REAL value: integral values as integers, others as the shortest exact form"""
+        if value is None:
+            return ''
+        if isinstance(value, float) and value.is_integer() and abs(value) < 2 ** 53:
+            return str(int(value))
+        return repr(value)
+    
+    def _merge_column_types(self, current: Optional[str], new: Optional[str]) -> Optional[str]:
+        """Combine two column types (None means no values seen yet); conflicts fall back to TEXT"""
+        if current is None or current == new:
+            return new if current is None else current
+        if new is None:
+            return current
+        if {current, new} == {"INTEGER", "REAL"}:
+            return "REAL"
+        return "TEXT"
+    
+    def _infer_column_types(self, rows: List[List[Any]], width: int) -> List[Optional[str]]:
+        """Infer one type per column from a chunk of rows, column by column (None for empty columns)"""
+        column_types = []
+        for index in range(width):
+            column_type = None
+            for row in rows:
+                if index < len(row) and row[index] != '':
+                    column_type = self._merge_column_types(column_type, self._value_type(row[index]))
+                    if column_type == "TEXT":
+                        break
+            column_types.append(column_type)
+        return column_types
+    
+    def _table_column_types(self, cursor: sqlite3.Cursor, table_name: str) -> List[str]:
+        """Declared types of a table's data columns (row_id excluded)"""
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        return [column[2] or "TEXT" for column in cursor.fetchall()][1:]
+    
+    def _typed_row(self, row: List[Any], width: int, column_types: List[str]) -> List[Any]:
+        """Pad a row to width and convert its cells to the column types (empty typed cells become NULL)"""
+        padded = row[:width] + [''] * (width - len(row))
+        return [
+            value if column_type == "TEXT" else self._typed_value(value, column_type)
+            for value, column_type in zip(padded, column_types)
+        ]
+    
+    def _typed_value(self, value, column_type: str):
+        """Convert one cell to a typed column's storage value"""
+        if value == '':
+            return None
+        if column_type == "INTEGER":
+            return int(value)
+        if column_type == "REAL":
+            return float(value)
+        if column_type == "BOOLEAN":
+            return 1 if value is True or value == "TRUE" else 0
+        return value
+    
+    def _widen_column_types(self, cursor: sqlite3.Cursor, state: Dict[str, Any], rows: List[List[Any]]):
+        """Widen the ingest table's columns when a chunk holds values that do not fit (writer thread).
+        
+        Only typed columns are checked. A widened column is rebuilt from the values
+        already loaded, so the chunk can then be inserted with the new types.
+        """
+        column_types = state["column_types"]
+        typed = [index for index, column_type in enumerate(column_types) if column_type != "TEXT"]
+        if not typed or not rows:
+            return
+        
+        chunk_types = self._infer_column_types(rows, len(column_types))
+        widened = list(column_types)
+        for index in typed:
+            widened[index] = self._merge_column_types(column_types[index], chunk_types[index])
+        if widened == column_types:
+            return
+        
+        if state["mode"] in ("delta", "append"):
+            table, key_defs = f"_delta_{state['table_name']}", ["row_id INTEGER PRIMARY KEY", "_fingerprint TEXT"]
+        else:
+            table, key_defs = f"_staging_{state['table_name']}", ["row_id INTEGER PRIMARY KEY"]
+        logger.info(f"Widening column types for {state['table_name']}: {column_types} -> {widened}")
+        self._retype_table(cursor, table, key_defs, state["safe_headers"], column_types, widened)
+        state["column_types"] = widened
+    
+    def _retype_table(self, cursor: sqlite3.Cursor, table_name: str, key_defs: List[str],
+                      safe_headers: List[str], old_types: List[str], new_types: List[str]):
+        """Rebuild a table with new column types, converting existing values and keeping its indexes (no commit)"""
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                       (table_name,))
+        index_sql = [row[0] for row in cursor.fetchall()]
+        
+        column_defs = ', '.join(key_defs + [f"{h} {t}" for h, t in zip(safe_headers, new_types)])
+        select_list = ', '.join(
+            [key.split()[0] for key in key_defs] +
+            [self._cast_column_sql(h, old, new) for h, old, new in zip(safe_headers, old_types, new_types)]
+        )
+        
+        cursor.connection.create_function("_real_text", 1, self._real_text, deterministic=True)
+        cursor.execute(f"DROP TABLE IF EXISTS _retype_{table_name}")
+        cursor.execute(f"CREATE TABLE _retype_{table_name} ({column_defs})")
+        cursor.execute(f"INSERT INTO _retype_{table_name} SELECT {select_list} FROM {table_name}")
+        cursor.execute(f"DROP TABLE {table_name}")
+        cursor.execute(f"ALTER TABLE _retype_{table_name} RENAME TO {table_name}")
+        for sql in index_sql:
+            cursor.execute(sql)
+    
+    def _cast_column_sql(self, column: str, old_type: str, new_type: str) -> str:
+        """SQL expression converting a column's stored values from old_type to new_type"""
+        if old_type == new_type:
+            return column
+        if new_type == "REAL":
+            return f"CAST({column} AS REAL)"
+        if old_type == "REAL":
+            # SQLite's own REAL to TEXT cast keeps only 15 digits and appends ".0"
+            return f"_real_text({column})"
+        if old_type == "BOOLEAN":
+            return f"CASE WHEN {column} IS NULL THEN '' WHEN {column} THEN 'TRUE' ELSE 'FALSE' END"
+        return f"COALESCE(CAST({column} AS TEXT), '')"
+    
+    def _column_to_number(self, column: str) -> int:
+        """Convert column letter to number (A=1, Z=26, AA=27, etc.)"""
+        n = 0
+        for letter in column:
+            n = n * 26 + ord(letter) - ord('A') + 1
+        return n
     
     def _number_to_column(self, n: int) -> str:
         """Convert column number to letter (1=A, 26=Z, 27=AA, etc.)"""
@@ -239,6 +1898,88 @@ class GoogleSheetsService:
         current_rows = len(values) - 1 if values else 0
         current_cols = len(values[0]) if values else 0
         
+        return self._compare_sheet_state(cursor, spreadsheet_id, sheet_name, current_hash, current_rows, current_cols)
+    
+    def _get_sync_options(self, cursor: sqlite3.Cursor, spreadsheet_id: str, sheet_name: str) -> Dict[str, Any]:
+        """How and when a tab was last synced: grid row count, data extent, value
+        rendering, formatted companions and row limit"""
+        cursor.execute("""
+            SELECT grid_row_count, data_row_count, COALESCE(value_render, 'formatted'),
+                   COALESCE(keep_formatted, 0), COALESCE(max_rows, ?), sync_time
+            FROM _sheet_metadata WHERE spreadsheet_id = ? AND sheet_name = ?
+        """, (MAX_ROWS_PER_SYNC, spreadsheet_id, sheet_name))
+        grid_row_count, data_row_count, value_render, keep_formatted, max_rows, sync_time = (
+            cursor.fetchone() or (None, None, "formatted", 0, MAX_ROWS_PER_SYNC, None)
+        )
+        return {
+            "sync_time": sync_time,
+            "grid_row_count": grid_row_count,
+            "data_row_count": data_row_count,
+            "value_render": value_render,
+            "keep_formatted": bool(keep_formatted),
+            "max_rows": max_rows
+        }
+    
+    async def _fetch_synced_values(self, sheets_service, spreadsheet_id: str, sheet_name: str,
+                                   total_rows: int, total_cols: int, options: Dict[str, Any]):
+        """Yield a tab's rows the way its last sync fetched them (options from _get_sync_options).
+        
+        Planned like _plan_sheet: the row limit and chunking choice come from the
+        grid, and chunked tabs fetch from the stored extent on, so the rows and
+        their width (and hash) match what smart_sync stored.
+        """
+        row_limit = min(total_rows, options["max_rows"])
+        fetch_rows = row_limit
+        if self._needs_chunking(row_limit, total_cols):
+            fetch_rows = await self._estimate_row_extent(
+                sheets_service, spreadsheet_id, sheet_name, row_limit, total_cols, options["data_row_count"]
+            )
+        
+        chunks = self._fetch_sheet_values(sheets_service, spreadsheet_id, sheet_name, fetch_rows, total_cols,
+                                          value_render=options["value_render"], row_limit=row_limit)
+        if options["keep_formatted"]:
+            chunks = self._with_formatted_columns(chunks, self._fetch_sheet_values(
+                sheets_service, spreadsheet_id, sheet_name, fetch_rows, total_cols, row_limit=row_limit
+            ))
+        async for chunk in chunks:
+            yield chunk
+    
+    async def _resync_tab(self, sheets_service, spreadsheet_id: str, spreadsheet_title: str, sheet_name: str,
+                          table_name: str, grid_size: tuple, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Stream a synced tab back in the way its last sync fetched it, as a smart_sync change check.
+        
+        Chunks go through _stream_into_table, so memory stays at one chunk, and
+        _finalize_sheet_sync only publishes them if the content changed. Returns
+        its entry (status "synced" or "no_changes"), or None if the tab has no data.
+        """
+        async with self.sync_locks.hold(table_name):
+            conn = await self._run_db_write(self._get_db_connection)
+            cursor = await self._run_db_write(conn.cursor)
+            try:
+                chunks = self._fetch_synced_values(sheets_service, spreadsheet_id, sheet_name, *grid_size, options)
+                try:
+                    ingest = await self._stream_into_table(
+                        cursor, table_name, chunks, value_render=options["value_render"]
+                    )
+                except Exception:
+                    await self._run_db_write(self._drop_staging_tables, cursor, table_name)
+                    raise
+                if ingest is None:
+                    return None
+                
+                ingest.update(keep_formatted=options["keep_formatted"], max_rows=options["max_rows"])
+                strategy = {"recommended_action": "change_check",
+                            "cache_status": {"action": "change_check", "reason": "change_check"}}
+                return await self._run_db_write(
+                    self._finalize_sheet_sync, cursor, spreadsheet_id, spreadsheet_title, sheet_name, table_name,
+                    ingest, strategy, grid_size
+                )
+            finally:
+                await self._run_db_write(conn.close)
+    
+    def _compare_sheet_state(self, cursor: sqlite3.Cursor, spreadsheet_id: str, sheet_name: str,
+                             current_hash: str, current_rows: int, current_cols: int) -> Dict[str, Any]:
+        """Compare a sheet's current hash and dimensions with the last synced state"""
         cursor.execute("""
             SELECT content_hash, row_count, column_count, sync_time 
             FROM _sheet_metadata 
@@ -266,58 +2007,16 @@ class GoogleSheetsService:
         
         return {
             "is_new": False,
-            "has_changes": len(changes) > 0,
-            "changes": changes,
-            "last_sync": last_sync
-        }
-    
-    def _check_rate_limit(self) -> bool:
-        """Check if we're within rate limits"""
-        now = time.time()
-        
-        # Remove old API calls (older than 1 minute)
-        self.api_calls = [call_time for call_time in self.api_calls if now - call_time < 60]
-        
-        # Check if we're at the limit
-        if len(self.api_calls) >= self.max_calls_per_minute:
-            return False
-        
-        # Check minimum delay between calls
-        if now - self.last_api_call < self.min_delay_between_calls:
-            return False
-        
-        return True
-    
-    async def _wait_for_rate_limit(self):
-        """Wait until we can make another API call"""
-        while not self._check_rate_limit():
-            now = time.time()
-            
-            # Calculate wait time
-            wait_time = max(
-                self.min_delay_between_calls - (now - self.last_api_call),
-                0.1  # Minimum 100ms wait
-            )
-            
-            await asyncio.sleep(wait_time)
-    
-    def _record_api_call(self):
-        """Record an API call for rate limiting"""
-        now = time.time()
-        self.api_calls.append(now)
-        self.last_api_call = now
-        
-        # Prevent memory leak: keep only recent API calls (last 2 minutes)
-        self.api_calls = [call_time for call_time in self.api_calls if now - call_time < 120]
+            "has_changes": len(changes) > 0,
+            "changes": changes,
+            "last_sync": last_sync
+        }
     
     def cleanup(self):
-        """Clean up service state (call at end of tool execution)"""
-        # Clear rate limiting state to prevent cross-session contamination
-        self.api_calls.clear()
-        self.last_api_call = 0
-        
-        # Clear pending changes state  
-        self.pending_changes.clear()
+        """Release worker threads and API clients (call once, at server shutdown)"""
+        self._executor.shutdown(wait=False)
+        self._db_writer.shutdown(wait=False)
+        self._reset_credentials()
     
     def _should_debounce(self, spreadsheet_id: str) -> bool:
         """Check if we should wait before syncing due to recent changes"""
@@ -354,7 +2053,7 @@ class GoogleSheetsService:
         # Parse sync time
         try:
             sync_time = datetime.fromisoformat(sync_time_str.replace('Z', '+00:00'))
-            age_seconds = (datetime.now() - sync_time.replace(tzinfo=None)).total_seconds()
+            age_seconds = (datetime.utcnow() - sync_time.replace(tzinfo=None)).total_seconds()  # sync_time is UTC (CURRENT_TIMESTAMP)
         except:
             return {
                 "is_stale": True,
@@ -404,6 +2103,8 @@ class GoogleSheetsService:
             "is_stale": False,
             "reason": "cache_valid",
             "age_minutes": age_seconds / 60,
+            "cached_rows": expected_rows,
+            "last_sync": sync_time_str,
             "action": "use_cache"
         }
     
@@ -433,8 +2134,517 @@ class GoogleSheetsService:
             strategy["recommended_action"] = "wait_for_debounce"
         
         return strategy
+    
+    def _plan_sheet_sync(self, cursor: sqlite3.Cursor, spreadsheet_id: str, sheet_name: str,
+                         grid_properties: Dict[str, Any], value_render: str = "formatted") -> Dict[str, Any]:
+        """Decide how to sync a sheet before downloading any of its values.
+        
+        Combines the cache strategy with the grid dimensions from the spreadsheet
+        metadata call, so tabs that can be served from SQLite are never fetched.
+        A cached copy synced with a different value_render is re-checked.
+        """
+        strategy = self._get_cache_strategy(cursor, spreadsheet_id, sheet_name)
+        
+        if strategy["recommended_action"] != "use_cache":
+            return strategy
+        
+        # A resized grid means rows or columns were added/removed since the last sync
+        cursor.execute("""
+            SELECT grid_row_count, grid_column_count, value_render
+            FROM _sheet_metadata
+            WHERE spreadsheet_id = ? AND sheet_name = ?
+        """, (spreadsheet_id, sheet_name))
+        result = cursor.fetchone()
+        stored_rows, stored_cols, stored_render = result if result else (None, None, None)
+        
+        current_rows = grid_properties.get('rowCount', 0)
+        current_cols = grid_properties.get('columnCount', 0)
+        
+        if stored_rows is not None and (stored_rows, stored_cols) != (current_rows, current_cols):
+            strategy["recommended_action"] = "change_check"
+            strategy["grid_changed"] = f"{stored_rows}x{stored_cols} → {current_rows}x{current_cols}"
+        elif (stored_render or "formatted") != value_render:
+            strategy["recommended_action"] = "change_check"
+            strategy["value_render_changed"] = f"{stored_render or 'formatted'} → {value_render}"
+        
+        return strategy
+
+    async def _plan_sheet(self, sheets_service, cursor: sqlite3.Cursor, spreadsheet_id: str,
+                          sheet: Dict[str, Any], max_rows: int, value_render: str = "formatted",
+                          keep_formatted: bool = False, sync_mode: str = "full") -> Dict[str, Any]:
+        """Work out how a tab will be synced, from metadata wherever possible.
+        
+        plan["entry"] is set when the tab needs no fetch (cached or debounced).
+        row_limit is the grid's row count capped at max_rows. Tabs large enough
+        to chunk plan fetch_rows on an estimate of their data extent instead (see
+        _estimate_row_extent); the fetch goes past it up to row_limit. Append
+        syncs skip the estimate: they only fetch below the synced rows, and the
+        values API already trims the empty grid after them.
+        """
+        sheet_title = sheet['properties']['title']
+        
+        # Create safe table name
+        safe_name = re.sub(r'[^a-zA-Z0-9_]', '_', sheet_title.lower())
+        safe_name = f"sheet_{safe_name}" if safe_name[0].isdigit() else safe_name
+        
+        # Get sheet dimensions to determine if chunking is needed
+        grid_properties = sheet['properties'].get('gridProperties', {})
+        sheet_rows = grid_properties.get('rowCount', 0)
+        sheet_cols = grid_properties.get('columnCount', 0)
+        
+        # Plan from metadata alone so cached tabs never download their values
+        cache_strategy = await self._run_db_write(
+            self._plan_sheet_sync, cursor, spreadsheet_id, sheet_title, grid_properties, value_render
+        )
+        
+        plan = {
+            "sheet_title": sheet_title,
+            "safe_name": safe_name,
+            "grid_size": (sheet_rows, sheet_cols),
+            "cache_strategy": cache_strategy,
+            "row_limit": min(sheet_rows, max_rows),
+            # Rows planned for the fetch (an estimate of the data extent for chunked tabs)
+            "fetch_rows": min(sheet_rows, max_rows),
+            "value_render": value_render,
+            # Formatted companion columns only make sense next to unformatted values
+            "keep_formatted": keep_formatted and value_render == "unformatted",
+            "max_rows": max_rows,
+            # An interrupted ingest may resume (see _get_resume_state), so no header probe is batched
+            "checkpointed": False,
+            "entry": None
+        }
+        
+        if cache_strategy["recommended_action"] == "use_cache":
+            plan["entry"] = {
+                "sheet_name": sheet_title,
+                "table_name": safe_name,
+                "rows": cache_strategy["cache_status"]["cached_rows"],
+                "status": "cached",
+                "cache_age_minutes": cache_strategy["cache_status"]["age_minutes"],
+                "last_sync": cache_strategy["cache_status"]["last_sync"]
+            }
+        elif cache_strategy["recommended_action"] == "wait_for_debounce":
+            plan["entry"] = {
+                "sheet_name": sheet_title,
+                "table_name": safe_name,
+                "status": "debounced",
+                "message": f"Waiting {self.debounce_seconds}s for changes to settle"
+            }
+        elif self._needs_chunking(plan["fetch_rows"], sheet_cols) and sync_mode != "append":
+            known_extent = await self._run_db_write(self._get_known_extent, cursor, spreadsheet_id, sheet_title)
+            data_rows = await self._estimate_row_extent(
+                sheets_service, spreadsheet_id, sheet_title, plan["row_limit"], sheet_cols, known_extent
+            )
+            if data_rows < plan["row_limit"]:
+                logger.info(f"{sheet_title}: data estimated to end at row {data_rows} of {sheet_rows} grid rows")
+            plan["fetch_rows"] = data_rows
+            plan["checkpointed"] = not plan["keep_formatted"] and await self._run_db_write(
+                self._has_checkpoint, cursor, safe_name
+            )
+        
+        return plan
+    
+    async def _estimate_row_extent(self, sheets_service, spreadsheet_id: str, sheet_name: str,
+                                   limit: int, width: int, known_extent: Optional[int] = None) -> int:
+        """Estimate the last non-empty row (up to limit), as a hint for planning a chunked fetch.
+        
+        A tab synced before uses the extent its last sync recorded. Otherwise one
+        batchGet reads short full-width windows spread down the grid, within
+        extent_probe_cells, and the estimate is the last row any of them holds.
+        The fetch carries on past the estimate until a range comes back empty, so
+        rows the windows miss are still synced.
+        """
+        if known_extent:
+            return min(known_extent, limit)
+        
+        height = min(self.extent_probe_rows, limit)
+        windows = max(1, min(self.extent_probe_windows, limit // height,
+                             self.extent_probe_cells // (height * max(width, 1))))
+        last_col = self._number_to_column(max(width, 1))
+        starts = [max(1, index * limit // windows - height + 1) for index in range(1, windows + 1)]
+        ranges = [f"'{sheet_name}'!A{start}:{last_col}{start + height - 1}" for start in starts]
+        window_values = await self._batch_get_values(sheets_service, spreadsheet_id, ranges)
+        found = [start + len(values) - 1 for start, values in zip(starts, window_values) if values]
+        # Nothing in any window: plan a single chunk and let the fetch find the end
+        return max(found, default=min(limit, self.chunking_threshold_rows))
+    
+    def _get_known_extent(self, cursor: sqlite3.Cursor, spreadsheet_id: str, sheet_name: str) -> Optional[int]:
+        """Last non-empty row recorded by the previous sync of a tab, if any (writer thread)"""
+        cursor.execute("""
+            SELECT data_row_count FROM _sheet_metadata
+            WHERE spreadsheet_id = ? AND sheet_name = ?
+        """, (spreadsheet_id, sheet_name))
+        result = cursor.fetchone()
+        return result[0] if result else None
+    
+    async def _sync_sheet(self, sheets_service, cursor: sqlite3.Cursor, spreadsheet_id: str,
+                          spreadsheet_title: str, plan: Dict[str, Any], prefetched=None,
+                          sync_mode: str = "full", formatted_prefetched=None) -> Optional[Dict[str, Any]]:
+        """Sync one planned tab and return its smart_sync entry (None for empty tabs).
+        
+        formatted_prefetched is this tab's batched formatted values when the plan
+        keeps formatted companion columns.
+        """
+        if plan["entry"] is not None:
+            return plan["entry"]
+        
+        if plan["row_limit"] <= 0:
+            return None
+        
+        # The private tables and checkpoint are per tab; another sync of it finishes first
+        async with self.sync_locks.hold(plan["safe_name"]):
+            sheet_title = plan["sheet_title"]
+            safe_name = plan["safe_name"]
+            append_fallback = None
+            checkpoint = resume_from = None
+            
+            # Stream into private tables; the live table is only touched once loading is complete
+            try:
+                ingest = None
+                if sync_mode == "append":
+                    ingest, append_fallback = await self._stream_appended_rows(
+                        sheets_service, cursor, spreadsheet_id, plan
+                    )
+                
+                if ingest is None:
+                    ingest_mode = "delta" if sync_mode == "append" else sync_mode
+                    fetch_size = (plan["fetch_rows"], plan["grid_size"][1])
+                    
+                    # Chunked fetches are checkpointed per chunk so an interrupted sync can pick up where it stopped
+                    if self._needs_chunking(plan["row_limit"], plan["grid_size"][1]) and not plan["keep_formatted"]:
+                        checkpoint = {
+                            "spreadsheet_id": spreadsheet_id,
+                            "sheet_name": sheet_title,
+                            "sync_mode": ingest_mode,
+                            "grid_size": plan["grid_size"]
+                        }
+                        resume_from = await self._get_resume_state(sheets_service, cursor, plan, checkpoint)
+                    
+                    if resume_from is not None:
+                        logger.info(f"Resuming {sheet_title} after row {resume_from['row_count'] + 1}")
+                        chunks = self._fetch_sheet_chunked(
+                            sheets_service, spreadsheet_id, sheet_title, plan["fetch_rows"],
+                            chunk_size=50000 if plan["fetch_rows"] > 100000 else 10000,
+                            start_row=resume_from["row_count"] + 2,
+                            last_col=self._number_to_column(len(resume_from["headers"])),
+                            value_render=plan["value_render"], row_limit=plan["row_limit"]
+                        )
+                    else:
+                        chunks = self._fetch_sheet_values(
+                            sheets_service, spreadsheet_id, sheet_title, *fetch_size, prefetched, plan["value_render"],
+                            plan["row_limit"]
+                        )
+                    if plan["keep_formatted"]:
+                        chunks = self._with_formatted_columns(chunks, self._fetch_sheet_values(
+                            sheets_service, spreadsheet_id, sheet_title, *fetch_size, formatted_prefetched,
+                            row_limit=plan["row_limit"]
+                        ))
+                    ingest = await self._stream_into_table(
+                        cursor, safe_name, chunks, ingest_mode, value_render=plan["value_render"],
+                        checkpoint=checkpoint, resume_from=resume_from
+                    )
+            except Exception:
+                # Checkpointed chunks stay for the next sync to resume from
+                if checkpoint is None:
+                    await self._run_db_write(self._drop_staging_tables, cursor, safe_name)
+                raise
+            
+            if ingest is None:
+                return None
+            
+            # Recorded so background refreshes sync the tab the same way
+            ingest.update(keep_formatted=plan["keep_formatted"], max_rows=plan["max_rows"])
+            entry = await self._run_db_write(
+                self._finalize_sheet_sync, cursor, spreadsheet_id, spreadsheet_title, sheet_title,
+                safe_name, ingest, plan["cache_strategy"], plan["grid_size"]
+            )
+            if append_fallback:
+                entry["append_fallback"] = append_fallback
+            return entry
+    
+    async def _get_resume_state(self, sheets_service, cursor: sqlite3.Cursor, plan: Dict[str, Any],
+                                checkpoint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Ingest state to resume a tab from its last checkpoint, or None to start over.
+        
+        The checkpoint must be recent and describe the same spreadsheet, grid size,
+        rendering and mode, and the sheet's header row and the rows just before the
+        checkpoint must still hold what was loaded (one batchGet, like append mode).
+        The content hash continues from the checkpoint's (see ContentHash), so a
+        resumed sync ends with the same hash as a straight one.
+        """
+        state = await self._run_db_write(self._load_checkpoint, cursor, plan["safe_name"])
+        if state is None:
+            return None
+        
+        if (state["spreadsheet_id"] != checkpoint["spreadsheet_id"]
+                or state["sheet_name"] != checkpoint["sheet_name"]
+                or state["sync_mode"] != checkpoint["sync_mode"]
+                or state["value_render"] != plan["value_render"]
+                or tuple(state["grid_size"]) != tuple(plan["grid_size"])
+                or time.time() - state["created_at"] > self.checkpoint_max_age_seconds
+                or state["row_count"] + 1 > plan["row_limit"]):
+            return None
+        
+        sheet_title = plan["sheet_title"]
+        width = len(state["headers"])
+        last_col = self._number_to_column(width)
+        tail_count = len(state["tail"])
+        ranges = [f"'{sheet_title}'!1:1"]
+        if tail_count:
+            ranges.append(f"'{sheet_title}'!A{state['row_count'] - tail_count + 2}:{last_col}{state['row_count'] + 1}")
+        probes = await self._batch_get_values(sheets_service, checkpoint["spreadsheet_id"], ranges,
+                                              plan["value_render"])
+        
+        header_row = probes[0][0] if probes[0] else []
+        tail_rows = probes[1] if tail_count else []
+        tail_rows = tail_rows + [[] for _ in range(tail_count - len(tail_rows))]
+        if header_row != state["headers"] or [self._trim_row(row, width) for row in tail_rows] != state["tail"]:
+            logger.info(f"{sheet_title} changed since its checkpoint; starting over")
+            return None
+        return state
+    
+    async def _stream_appended_rows(self, sheets_service, cursor: sqlite3.Cursor, spreadsheet_id: str,
+                                    plan: Dict[str, Any]) -> tuple:
+        """Load only the rows added since the last sync of a log-style sheet.
+        
+        Verifies the header row and the fingerprint of the last synced rows first.
+        Returns (ingest, None) on success, or (None, reason) when a full sync is needed.
+        """
+        sheet_title = plan["sheet_title"]
+        
+        if self._should_force_refresh(plan["cache_strategy"]["cache_status"]):
+            return None, plan["cache_strategy"]["cache_status"]["reason"]
+        
+        if plan["keep_formatted"]:
+            # Companion columns are chosen from a sheet's first chunk, which an append never sees
+            return None, "keep_formatted"
+        
+        previous = await self._run_db_write(
+            self._get_append_state, cursor, spreadsheet_id, sheet_title, plan["safe_name"]
+        )
+        if previous is None:
+            return None, "no_tail_fingerprint"
+        
+        if previous["value_render"] != plan["value_render"]:
+            return None, "value_render_changed"
+        
+        synced_rows = previous["row_count"]
+        if plan["fetch_rows"] - 1 < synced_rows:
+            return None, "sheet_shrank"
+        
+        # Header row plus the trailing rows covered by the stored fingerprint
+        last_col = self._number_to_column(len(previous["headers"]))
+        tail_count = previous["tail_row_count"]
+        ranges = [f"'{sheet_title}'!1:1"]
+        if tail_count:
+            ranges.append(f"'{sheet_title}'!A{synced_rows - tail_count + 2}:{last_col}{synced_rows + 1}")
+        probes = await self._batch_get_values(sheets_service, spreadsheet_id, ranges, plan["value_render"])
+        
+        header_row = probes[0][0] if probes[0] else []
+        if header_row != previous["headers"]:
+            return None, "headers_changed"
+        
+        width = len(previous["headers"])
+        tail_rows = probes[1] if tail_count else []
+        # Rows trimmed from the end of the range were empty
+        tail_rows = tail_rows + [[] for _ in range(tail_count - len(tail_rows))]
+        tail_rows = [self._trim_row(row, width) for row in tail_rows]
+        if self._tail_fingerprint(tail_rows) != previous["tail_fingerprint"]:
+            return None, "tail_changed"
+        
+        previous["tail_rows"] = tail_rows
+        new_rows = self._fetch_sheet_chunked(
+            sheets_service, spreadsheet_id, sheet_title, plan["fetch_rows"],
+            chunk_size=50000 if plan["fetch_rows"] - synced_rows > 100000 else 10000,
+            start_row=synced_rows + 2, last_col=last_col, value_render=plan["value_render"]
+        )
+        ingest = await self._stream_into_table(cursor, plan["safe_name"], new_rows, "append", previous,
+                                               plan["value_render"])
+        return ingest, None
+    
+    def _get_append_state(self, cursor: sqlite3.Cursor, spreadsheet_id: str, sheet_name: str,
+                          safe_name: str) -> Optional[Dict[str, Any]]:
+        """Load what an append-mode sync needs to know about the previous sync (writer thread)"""
+        cursor.execute("""
+            SELECT row_count, hash_state, tail_row_count, tail_fingerprint, headers, value_render
+            FROM _sheet_metadata
+            WHERE spreadsheet_id = ? AND sheet_name = ?
+        """, (spreadsheet_id, sheet_name))
+        result = cursor.fetchone()
+        if not result or result[1] is None or result[3] is None or result[4] is None:
+            return None
+        
+        row_count, hash_state, tail_row_count, tail_fingerprint, headers_json, value_render = result
+        headers = json.loads(headers_json)
+        
+        # The live table must still have the columns the metadata describes
+        cursor.execute(f"PRAGMA table_info({safe_name})")
+        columns = cursor.fetchall()[1:]
+        if len(columns) != len(headers):
+            return None
+        
+        return {
+            "row_count": row_count,
+            "hash_state": hash_state,
+            "tail_row_count": tail_row_count,
+            "tail_fingerprint": tail_fingerprint,
+            "headers": headers,
+            "safe_headers": [column[1] for column in columns],
+            "column_types": [column[2] or "TEXT" for column in columns],
+            "value_render": value_render or "formatted"
+        }
+    
+    def _finalize_sheet_sync(self, cursor: sqlite3.Cursor, spreadsheet_id: str, spreadsheet_title: str,
+                             sheet_title: str, safe_name: str, ingest: Dict[str, Any],
+                             cache_strategy: Dict[str, Any], grid_size: tuple) -> Dict[str, Any]:
+        """Publish a finished ingest (or discard it if unchanged) and record metadata (writer thread)"""
+        headers = ingest["headers"]
+        safe_headers = ingest["safe_headers"]
+        row_count = ingest["row_count"]
+        content_hash = ingest["content_hash"]
+        sheet_rows, sheet_cols = grid_size
+        
+        change_info = self._compare_sheet_state(
+            cursor, spreadsheet_id, sheet_title, content_hash, row_count, len(headers)
+        )
+        
+        if (cache_strategy["recommended_action"] == "change_check"
+                and not change_info["has_changes"]
+                and not self._should_force_refresh(cache_strategy["cache_status"])):
+            self._drop_staging_tables(cursor, safe_name)
+            
+            # Content verified unchanged - restart the cache TTL so the next sync skips the fetch
+            cursor.execute("""
+                UPDATE _sheet_metadata
+                SET sync_time = CURRENT_TIMESTAMP, grid_row_count = ?, grid_column_count = ?, value_render = ?,
+                    data_row_count = ?, hash_state = ?
+                WHERE spreadsheet_id = ? AND sheet_name = ?
+            """, (sheet_rows, sheet_cols, ingest["value_render"], row_count + 1, ingest["hash_state"],
+                  spreadsheet_id, sheet_title))
+            cursor.connection.commit()
+            
+            return {
+                "sheet_name": sheet_title,
+                "table_name": safe_name,
+                "rows": row_count,
+                "status": "no_changes",
+                "cache_status": cache_strategy["cache_status"]["reason"],
+                "last_sync": change_info.get("last_sync")
+            }
+        
+        try:
+            if ingest["mode"] in ("delta", "append"):
+                self._apply_delta(cursor, safe_name, safe_headers, ingest["column_types"], row_count)
+            else:
+                self._swap_in_staging(cursor, safe_name, safe_headers, row_count, ingest["record_fingerprints"])
+            cursor.execute("DELETE FROM _sync_checkpoints WHERE table_name = ?", (safe_name,))
+            
+            # Update metadata
+            cursor.execute("""
+                INSERT OR REPLACE INTO _sheet_metadata 
+                (spreadsheet_id, spreadsheet_title, sheet_name, table_name, row_count, column_count, content_hash,
+                 grid_row_count, grid_column_count, tail_row_count, tail_fingerprint, headers, column_types,
+                 value_render, data_row_count, keep_formatted, max_rows, hash_state)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (spreadsheet_id, spreadsheet_title, sheet_title, safe_name, row_count, len(headers), content_hash,
+                  sheet_rows, sheet_cols, ingest["tail_row_count"], ingest["tail_fingerprint"], json.dumps(headers),
+                  json.dumps(ingest["column_types"]), ingest["value_render"], row_count + 1,
+                  int(ingest["keep_formatted"]), ingest["max_rows"], ingest["hash_state"]))
+            self._store_block_hashes(cursor, safe_name, ingest["block_hashes"], replace=ingest["mode"] != "append")
+            cursor.connection.commit()
+        except Exception:
+            cursor.connection.rollback()
+            raise
+        
+        entry = {
+            "sheet_name": sheet_title,
+            "table_name": safe_name,
+            "rows": row_count,
+            "columns": safe_headers,
+            "status": "synced",
+            "sync_mode": ingest["mode"],
+            "changes": change_info["changes"]
+        }
+        if ingest["mode"] == "delta":
+            entry["rows_changed"] = ingest["rows_changed"]
+        elif ingest["mode"] == "append":
+            entry["rows_appended"] = ingest["rows_changed"]
+        return entry
+    
+    def _swap_in_staging(self, cursor: sqlite3.Cursor, safe_name: str, safe_headers: List[str],
+                         row_count: int, record_fingerprints: bool = False):
+        """Atomically replace the live table with the fully loaded _staging_<name> table.
+        
+        Indexes are built on the staging table beforehand, so the transaction is
+        just DROP + RENAME and bookkeeping; concurrent readers see either the old
+        or the new complete table, never a missing one. The caller adds its
+        metadata update and commits.
+        """
+        # Add indexes before the swap for better performance
+        if row_count > 10000:
+            # Create indexes on commonly queried columns (first few columns often used)
+            for header in safe_headers[:3]:
+                try:
+                    index_name = self._free_index_name(cursor, f"idx_{safe_name}_{header}")
+                    cursor.execute(f"CREATE INDEX {index_name} ON _staging_{safe_name}({header})")
+                except:
+                    pass  # Index creation might fail for some columns
+        
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute(f"DROP TABLE IF EXISTS {safe_name}")
+        cursor.execute(f"ALTER TABLE _staging_{safe_name} RENAME TO {safe_name}")
+        
+        # Fingerprints of the previous version no longer describe the table
+        cursor.execute("DELETE FROM _row_fingerprints WHERE table_name = ?", (safe_name,))
+        if record_fingerprints:
+            cursor.execute(f"""
+                INSERT INTO _row_fingerprints (table_name, row_id, fingerprint)
+                SELECT ?, row_id, fingerprint FROM _staging_{safe_name}_fp
+            """, (safe_name,))
+            cursor.execute(f"DROP TABLE _staging_{safe_name}_fp")
+    
+    def _free_index_name(self, cursor: sqlite3.Cursor, index_name: str) -> str:
+        """Pick index_name, or its alternate while the live table still holds that name"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (index_name,))
+        return f"{index_name}_1" if cursor.fetchone() else index_name
+    
+    def _apply_delta(self, cursor: sqlite3.Cursor, safe_name: str, safe_headers: List[str],
+                     column_types: List[str], row_count: int):
+        """Apply the changed rows in _delta_<name> to the live table in one transaction.
+        
+        Rows are keyed by their position in the sheet, so rows beyond the new row
+        count are deleted. If the ingest widened any column types the live table is
+        rebuilt with them first. The caller commits (together with the metadata update).
+        """
+        column_list = ', '.join(['row_id'] + safe_headers)
+        
+        cursor.execute("BEGIN IMMEDIATE")
+        live_types = self._table_column_types(cursor, safe_name)
+        if live_types != column_types:
+            self._retype_table(cursor, safe_name, ["row_id INTEGER PRIMARY KEY"], safe_headers, live_types, column_types)
+        cursor.execute(f"""
+            INSERT OR REPLACE INTO {safe_name} ({column_list})
+            SELECT {column_list} FROM _delta_{safe_name}
+        """)
+        cursor.execute(f"""
+            INSERT OR REPLACE INTO _row_fingerprints (table_name, row_id, fingerprint)
+            SELECT ?, row_id, _fingerprint FROM _delta_{safe_name}
+        """, (safe_name,))
+        cursor.execute(f"DELETE FROM {safe_name} WHERE row_id > ?", (row_count,))
+        cursor.execute("DELETE FROM _row_fingerprints WHERE table_name = ? AND row_id > ?", (safe_name, row_count))
+        cursor.execute(f"DROP TABLE _delta_{safe_name}")
 
-# Service instances will be created per tool call to prevent session state issues
+# One service per server process. It only holds process-wide state (credentials, API clients,
+# worker threads, rate-limit and debounce bookkeeping); per-call state such as database
+# connections, cursors and sync plans stays local to each tool call.
+_service: Optional[GoogleSheetsService] = None
+
+def get_service() -> GoogleSheetsService:
+    """Return the process-wide service, creating it on first use"""
+    global _service
+    if _service is None:
+        _service = GoogleSheetsService()
+    return _service
 
 @app.list_tools()
 async def handle_list_tools() -> list[Tool]:
@@ -459,6 +2669,28 @@ async def handle_list_tools() -> list[Tool]:
                         "type": "array",
                         "items": {"type": "string"},
                         "description": "Specific sheets to sync (optional, syncs all if not provided)"
+                    },
+                    "sync_mode": {
+                        "type": "string",
+                        "enum": ["full", "delta", "append"],
+                        "description": "'full' rebuilds changed sheets; 'delta' writes only rows whose fingerprint changed; 'append' fetches only rows added since the last sync, for log-style sheets (default: full)",
+                        "default": "full"
+                    },
+                    "value_render": {
+                        "type": "string",
+                        "enum": ["formatted", "unformatted"],
+                        "description": "'formatted' stores cells as displayed; 'unformatted' stores native numbers, booleans and dates as serial numbers (default: formatted)",
+                        "default": "formatted"
+                    },
+                    "keep_formatted": {
+                        "type": "boolean",
+                        "description": "With value_render 'unformatted', also keep the displayed text of numeric columns in <column>_formatted companion columns (default: false)",
+                        "default": False
+                    },
+                    "background": {
+                        "type": "boolean",
+                        "description": "Return a job ID immediately and sync in the background; poll sync_status for progress (default: false)",
+                        "default": False
                     }
                 },
                 "required": ["url"]
@@ -561,6 +2793,24 @@ async def handle_list_tools() -> list[Tool]:
                         "type": "number",
                         "description": "Seconds to wait between sheet syncs (default: 1.0)",
                         "default": 1.0
+                    },
+                    "background": {
+                        "type": "boolean",
+                        "description": "Return a job ID immediately and sync in the background; poll sync_status for progress (default: false)",
+                        "default": False
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="sync_status",
+            description="Report progress of background sync jobs: rows fetched and inserted, rate, ETA and errors",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "Job ID returned by smart_sync or batch_sync_changes (optional - lists recent jobs if not provided)"
                     }
                 }
             }
@@ -571,13 +2821,42 @@ async def handle_list_tools() -> list[Tool]:
 async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls"""
     
+    # Long syncs can run as background jobs that the caller polls with sync_status
+    if name in ("smart_sync", "batch_sync_changes") and arguments.get("background"):
+        job = await start_sync_job(name, arguments)
+        return [TextContent(type="text", text=json.dumps({
+            "status": "started",
+            "job_id": job["job_id"],
+            "message": "Sync is running in the background. Call sync_status with this job_id for progress."
+        }, indent=2))]
+    
+    # Clients that pass a progress token get notifications while the sync runs (background jobs
+    # already carry their own counters)
+    progress = _current_progress.get()
+    if name in ("smart_sync", "batch_sync_changes") and (progress is None or "job_id" not in progress):
+        _current_progress.set(_progress_for_request())
+    
     if name == "smart_sync":
-        # Create fresh service instance for this tool call
-        service = GoogleSheetsService()
+        service = get_service()
         
         url = arguments.get("url")
         max_rows = arguments.get("max_rows", MAX_ROWS_PER_SYNC)
         target_sheets = arguments.get("sheets", [])
+        sync_mode = arguments.get("sync_mode", "full")
+        value_render = arguments.get("value_render", "formatted")
+        keep_formatted = arguments.get("keep_formatted", False)
+        
+        if sync_mode not in ("full", "delta", "append"):
+            return [TextContent(type="text", text=json.dumps({
+                "error": f"Invalid sync_mode: {sync_mode}",
+                "details": "sync_mode must be 'full', 'delta' or 'append'"
+            }))]
+        
+        if value_render not in VALUE_RENDER_OPTIONS:
+            return [TextContent(type="text", text=json.dumps({
+                "error": f"Invalid value_render: {value_render}",
+                "details": "value_render must be 'formatted' or 'unformatted'"
+            }))]
         
         # Enhanced input validation
         if not url or not isinstance(url, str) or not url.strip():
@@ -624,211 +2903,66 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                     "spreadsheet_id": spreadsheet_id
                 }))]
             
-            # Wait for rate limit if needed
-            await service._wait_for_rate_limit()
-            
-            sheets_service = build('sheets', 'v4', credentials=creds)
+            sheets_service = service.get_sheets_service(creds)
             
-            # Get spreadsheet metadata
-            service._record_api_call()
-            spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+            # Get spreadsheet metadata (always fresh - cache planning compares grid sizes)
+            spreadsheet = await service._get_spreadsheet_metadata(sheets_service, spreadsheet_id, max_age=0)
             title = spreadsheet['properties']['title']
             sheets = spreadsheet['sheets']
             
-            # Connect to database with optimal settings
-            conn = service._get_db_connection()
-            cursor = conn.cursor()
-            
-            synced_sheets = []
-            total_rows = 0
+            # All database work for this sync runs on the service's single writer thread
+            conn = await service._run_db_write(service._get_db_connection)
+            cursor = await service._run_db_write(conn.cursor)
             
-            for sheet in sheets:
-                sheet_title = sheet['properties']['title']
-                
+            selected_sheets = [
+                sheet for sheet in sheets
                 # Skip if specific sheets requested and this isn't one
-                if target_sheets and sheet_title not in target_sheets:
-                    continue
-                
-                # Create safe table name
-                safe_name = re.sub(r'[^a-zA-Z0-9_]', '_', sheet_title.lower())
-                safe_name = f"sheet_{safe_name}" if safe_name[0].isdigit() else safe_name
-                
-                # Get sheet dimensions to determine if chunking is needed
-                sheet_properties = sheet['properties']
-                grid_properties = sheet_properties.get('gridProperties', {})
-                sheet_rows = grid_properties.get('rowCount', 0)
-                sheet_cols = grid_properties.get('columnCount', 0)
-                
-                # Determine actual data rows (may be less than sheet dimensions)
-                actual_rows = min(sheet_rows, max_rows)
-                
-                # Decide whether to use chunked fetching
-                use_chunking = actual_rows > 10000
-                chunk_size = 50000 if actual_rows > 100000 else 10000
-                
-                values = []
-                headers = None
-                
-                if use_chunking and actual_rows > 0:
-                    # Use chunked fetching for large sheets
-                    logger.info(f"Using chunked fetching for {sheet_title}: {actual_rows} rows")
-                    
-                    async for chunk in service._fetch_sheet_chunked(
-                        sheets_service, spreadsheet_id, sheet_title, actual_rows, chunk_size
-                    ):
-                        if not headers:
-                            headers = chunk[0] if chunk else []
-                            values = chunk
-                        else:
-                            # Append data rows (skip header in subsequent chunks)
-                            values.extend(chunk[1:] if len(chunk) > 1 else [])
-                        
-                        # Break if we've reached max_rows
-                        if len(values) >= max_rows:
-                            values = values[:max_rows]
-                            break
-                else:
-                    # Use traditional single fetch for smaller sheets
-                    await service._wait_for_rate_limit()
-                    range_name = f"'{sheet_title}'!A1:Z{max_rows}"
-                    service._record_api_call()
-                    result = sheets_service.spreadsheets().values().get(
-                        spreadsheetId=spreadsheet_id,
-                        range=range_name
-                    ).execute()
-                    
-                    values = result.get('values', [])
-                
-                if not values:
-                    continue
-                
-                # Initialize change_info for this sheet iteration
-                change_info = None
-                
-                # Get caching strategy for this sheet
-                cache_strategy = service._get_cache_strategy(cursor, spreadsheet_id, sheet_title)
-                
-                # Handle different cache strategies
-                if cache_strategy["recommended_action"] == "use_cache":
-                    synced_sheets.append({
-                        "sheet_name": sheet_title,
-                        "table_name": safe_name,
-                        "rows": cache_strategy["cache_status"].get("expected", len(values) - 1),
-                        "status": "cached",
-                        "cache_age_minutes": cache_strategy["cache_status"]["age_minutes"],
-                        "last_sync": cache_strategy["cache_status"].get("last_sync")
-                    })
-                    continue
-                elif cache_strategy["recommended_action"] == "wait_for_debounce":
-                    synced_sheets.append({
-                        "sheet_name": sheet_title,
-                        "table_name": safe_name,
-                        "status": "debounced",
-                        "message": f"Waiting {service.debounce_seconds}s for changes to settle"
-                    })
-                    continue
-                elif cache_strategy["recommended_action"] == "change_check":
-                    # Check for actual changes
-                    change_info = service._get_sheet_changes(cursor, spreadsheet_id, sheet_title, values)
-                    
-                    if not change_info["has_changes"] and not service._should_force_refresh(cache_strategy["cache_status"]):
-                        synced_sheets.append({
-                            "sheet_name": sheet_title,
-                            "table_name": safe_name,
-                            "rows": len(values) - 1,
-                            "status": "no_changes",
-                            "cache_status": cache_strategy["cache_status"]["reason"],
-                            "last_sync": change_info.get("last_sync")
-                        })
-                        continue
-                # If we reach here, we need to perform a full sync
-                # Ensure change_info is set for full sync scenarios
-                if change_info is None:
-                    change_info = service._get_sheet_changes(cursor, spreadsheet_id, sheet_title, values)
-                
-                # Create table
-                headers = values[0] if values else []
-                safe_headers = [re.sub(r'[^a-zA-Z0-9_]', '_', h.lower()) for h in headers]
-                
-                # Drop existing table
-                cursor.execute(f"DROP TABLE IF EXISTS {safe_name}")
-                
-                # Create new table with row ID and optimized column types
-                columns = 'row_id INTEGER PRIMARY KEY, ' + ', '.join([f"{h} TEXT" for h in safe_headers])
-                cursor.execute(f"CREATE TABLE {safe_name} ({columns})")
-                
-                # Prepare data for bulk insert
-                data_rows = values[1:] if len(values) > 1 else []
-                row_count = len(data_rows)
-                
-                if row_count > 0:
-                    # Use bulk insert with executemany for performance
-                    bulk_data = []
-                    for idx, row in enumerate(data_rows, 1):
-                        # Pad row to match headers
-                        padded_row = row + [''] * (len(headers) - len(row))
-                        bulk_data.append([idx] + padded_row)
-                    
-                    # Insert in batches for optimal performance
-                    batch_size = 10000
-                    placeholders = ', '.join(['?' for _ in range(len(headers) + 1)])
-                    
-                    for i in range(0, len(bulk_data), batch_size):
-                        batch = bulk_data[i:i + batch_size]
-                        cursor.executemany(f"INSERT INTO {safe_name} VALUES ({placeholders})", batch)
-                        
-                        # Log progress for large datasets
-                        if row_count > 10000:
-                            progress = min(i + batch_size, row_count)
-                            logger.info(f"Inserted {progress}/{row_count} rows into {safe_name}")
-                
-                total_rows += row_count
-                
-                # Calculate content hash efficiently
-                if use_chunking and row_count > 100000:
-                    # Use sampling for very large datasets
-                    sample_size = min(10000, row_count)
-                    sample_indices = range(0, row_count, row_count // sample_size)
-                    sample_values = [values[0]] + [values[i+1] for i in sample_indices if i+1 < len(values)]
-                    content_hash = service._calculate_content_hash(sample_values)
-                else:
-                    content_hash = service._calculate_content_hash(values)
-                
-                # Add indexes after bulk insert for better performance
-                if row_count > 10000:
-                    # Create indexes on commonly queried columns (first few columns often used)
-                    for i, header in enumerate(safe_headers[:3]):
-                        try:
-                            cursor.execute(f"CREATE INDEX idx_{safe_name}_{header} ON {safe_name}({header})")
-                        except:
-                            pass  # Index creation might fail for some columns
-                
-                # Update metadata
-                cursor.execute("""
-                    INSERT OR REPLACE INTO _sheet_metadata 
-                    (spreadsheet_id, spreadsheet_title, sheet_name, table_name, row_count, column_count, content_hash)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (spreadsheet_id, title, sheet_title, safe_name, row_count, len(headers), content_hash))
-                
-                synced_sheets.append({
-                    "sheet_name": sheet_title,
-                    "table_name": safe_name,
-                    "rows": row_count,
-                    "columns": safe_headers,
-                    "status": "synced",
-                    "changes": change_info["changes"]
-                })
-                
-                # Memory cleanup for large datasets
-                if row_count > 50000:
-                    del values
-                    if 'bulk_data' in locals():
-                        del bulk_data
-                    gc.collect()
-                    logger.info(f"Memory cleanup performed after syncing {sheet_title}")
+                if not target_sheets or sheet['properties']['title'] in target_sheets
+            ]
             
-            conn.commit()
-            conn.close()
+            plans = await asyncio.gather(*(
+                service._plan_sheet(sheets_service, cursor, spreadsheet_id, sheet, max_rows, value_render,
+                                    keep_formatted, sync_mode)
+                for sheet in selected_sheets
+            ))
+            
+            await service._report_progress(rows_expected=sum(
+                plan["fetch_rows"] for plan in plans if plan["entry"] is None
+            ))
+            
+            # Small tabs and header probes are fetched with as few batchGet calls as possible
+            # (append mode fetches only new rows, so there is nothing to batch up front)
+            prefetched = {} if sync_mode == "append" else service._prefetch_tabs(
+                sheets_service, spreadsheet_id, plans, value_render
+            )
+            formatted_prefetched = {}
+            if sync_mode != "append" and any(plan["keep_formatted"] for plan in plans):
+                formatted_prefetched = service._prefetch_tabs(sheets_service, spreadsheet_id, plans)
+            
+            # Sync tabs concurrently; they share the rate limiter and the writer thread
+            semaphore = asyncio.Semaphore(service.max_concurrent_tabs)
+            
+            async def sync_tab(plan):
+                _current_sheet.set(plan["sheet_title"])
+                async with semaphore:
+                    try:
+                        return await service._sync_sheet(
+                            sheets_service, cursor, spreadsheet_id, title, plan,
+                            prefetched.get(plan["sheet_title"]), sync_mode,
+                            formatted_prefetched.get(plan["sheet_title"])
+                        )
+                    except Exception as e:
+                        return {
+                            "sheet_name": plan["sheet_title"],
+                            "status": "error",
+                            "error": str(e)
+                        }
+            
+            tab_results = await asyncio.gather(*(sync_tab(plan) for plan in plans))
+            synced_sheets = [entry for entry in tab_results if entry is not None]
+            total_rows = sum(entry["rows"] for entry in synced_sheets if entry["status"] == "synced")
+            
+            await service._run_db_write(conn.commit)
             
             result = {
                 "status": "success",
@@ -845,16 +2979,14 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
             # Clean up resources
             if conn:
                 try:
-                    conn.close()
+                    await service._run_db_write(conn.close)
                 except:
                     pass
-            service.cleanup()
         
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "query_sheets":
-        # Create fresh service instance for this tool call
-        service = GoogleSheetsService()
+        service = get_service()
         
         query = arguments.get("query", "")
         
@@ -918,8 +3050,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "list_synced_sheets":
-        # Create fresh service instance for this tool call
-        service = GoogleSheetsService()
+        service = get_service()
         
         try:
             with service._get_db_connection() as conn:
@@ -957,8 +3088,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "analyze_sheets":
-        # Create fresh service instance for this tool call
-        service = GoogleSheetsService()
+        service = get_service()
         
         question = arguments.get("question", "")
         
@@ -1019,8 +3149,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "get_sheet_preview":
-        # Create fresh service instance for this tool call
-        service = GoogleSheetsService()
+        service = get_service()
         
         url = arguments.get("url", "")
         sheet_name = arguments.get("sheet_name")
@@ -1041,21 +3170,23 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
             return [TextContent(type="text", text=json.dumps(error_msg, indent=2))]
         
         try:
-            sheets_service = build('sheets', 'v4', credentials=creds)
+            sheets_service = service.get_sheets_service(creds)
             
             # Get spreadsheet info
-            spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+            spreadsheet = await service._get_spreadsheet_metadata(sheets_service, spreadsheet_id)
             title = spreadsheet['properties']['title']
             sheet_names = [s['properties']['title'] for s in spreadsheet['sheets']]
             
             # Get preview of specified or first sheet
             target_sheet = sheet_name if sheet_name and sheet_name in sheet_names else sheet_names[0]
-            range_name = f"'{target_sheet}'!A1:Z{rows}"
+            grid_props = spreadsheet['sheets'][sheet_names.index(target_sheet)]['properties'].get('gridProperties', {})
+            last_col = service._number_to_column(max(grid_props.get('columnCount', 0), 1))
+            range_name = f"'{target_sheet}'!A1:{last_col}{rows}"
             
-            result = sheets_service.spreadsheets().values().get(
+            result = await service._execute_request(sheets_service.spreadsheets().values().get(
                 spreadsheetId=spreadsheet_id,
                 range=range_name
-            ).execute()
+            ))
             
             values = result.get('values', [])
             
@@ -1075,8 +3206,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=json.dumps(preview, indent=2))]
     
     elif name == "check_sheet_changes":
-        # Create fresh service instance for this tool call
-        service = GoogleSheetsService()
+        service = get_service()
         
         url = arguments.get("url")
         auto_sync = arguments.get("auto_sync", False)
@@ -1092,7 +3222,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
             return [TextContent(type="text", text=json.dumps(error_msg, indent=2))]
         
         try:
-            sheets_service = build('sheets', 'v4', credentials=creds)
+            sheets_service = service.get_sheets_service(creds)
             
             # Get sheets to check
             sheets_to_check = []
@@ -1130,66 +3260,78 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
             changes_found = []
             synced_count = 0
             
+            # Tier zero: one Drive call per spreadsheet; unchanged versions skip every per-tab fetch
+            drive_versions = {}
+            unchanged_spreadsheets = set()
+            for spreadsheet_id in dict.fromkeys(sheet_info[0] for sheet_info in sheets_to_check):
+                drive_info = await service._get_drive_version(spreadsheet_id)
+                drive_versions[spreadsheet_id] = drive_info
+                if drive_info and service._drive_version_unchanged(spreadsheet_id, drive_info):
+                    unchanged_spreadsheets.add(spreadsheet_id)
+            
+            unresolved_spreadsheets = set()  # Changed or failed tabs left out of step
+            skipped_count = 0
+            
             for sheet_info in sheets_to_check:
                 spreadsheet_id, spreadsheet_title, sheet_name, table_name = sheet_info
                 
+                if spreadsheet_id in unchanged_spreadsheets:
+                    skipped_count += 1
+                    continue
+                
                 try:
-                    # First check sheet metadata for quick change detection
-                    sheet_meta = sheets_service.spreadsheets().get(
-                        spreadsheetId=spreadsheet_id,
-                        ranges=[f"'{sheet_name}'"],
-                        fields="sheets(properties)"
-                    ).execute()
+                    # First check sheet metadata for quick change detection (one call per spreadsheet)
+                    sheet_props = await service._get_sheet_properties(sheets_service, spreadsheet_id, sheet_name)
                     
                     # Get sheet dimensions for efficient checking
-                    sheet_props = sheet_meta['sheets'][0]['properties']
                     grid_props = sheet_props.get('gridProperties', {})
                     current_rows = grid_props.get('rowCount', 0)
+                    current_cols = grid_props.get('columnCount', 0)
                     
-                    # For large sheets, use sampling instead of fetching all data
-                    if current_rows > 10000:
-                        # Sample approach: check first 100, last 100, and some random rows
-                        sample_ranges = [
-                            f"'{sheet_name}'!A1:Z100",  # First 100 rows
-                            f"'{sheet_name}'!A{max(1, current_rows-100)}:Z{current_rows}"  # Last 100 rows
-                        ]
-                        
-                        batch_result = sheets_service.spreadsheets().values().batchGet(
-                            spreadsheetId=spreadsheet_id,
-                            ranges=sample_ranges
-                        ).execute()
-                        
-                        # Combine samples for hash calculation
-                        values = []
-                        for range_data in batch_result.get('valueRanges', []):
-                            values.extend(range_data.get('values', []))
-                    else:
-                        # For smaller sheets, get all data
-                        range_name = f"'{sheet_name}'!A1:Z{min(current_rows, 5000)}"
-                        result = sheets_service.spreadsheets().values().get(
-                            spreadsheetId=spreadsheet_id,
-                            range=range_name
-                        ).execute()
-                        values = result.get('values', [])
-                    
-                    # Check for changes
                     with service._get_db_connection() as temp_conn:
-                        temp_cursor = temp_conn.cursor()
-                        
-                        # Quick check: compare row counts first
-                        temp_cursor.execute("""
-                            SELECT row_count FROM _sheet_metadata 
-                            WHERE spreadsheet_id = ? AND sheet_name = ?
-                        """, (spreadsheet_id, sheet_name))
-                        
-                        stored_row_count = temp_cursor.fetchone()
-                        if stored_row_count and stored_row_count[0] != current_rows:
-                            change_info = {
-                                "has_changes": True,
-                                "changes": [f"Row count changed: {stored_row_count[0]} → {current_rows}"]
-                            }
+                        sync_options = service._get_sync_options(temp_conn.cursor(), spreadsheet_id, sheet_name)
+                    
+                    # Quick check: compare grid row counts first (the synced row count
+                    # excludes the grid's empty padding, so it is not comparable)
+                    stored_grid_rows = sync_options["grid_row_count"]
+                    grid_changed = stored_grid_rows is not None and stored_grid_rows != current_rows
+                    
+                    if auto_sync:
+                        # Stream the tab back in like smart_sync; it is only rewritten if it changed
+                        entry = await service._resync_tab(
+                            sheets_service, spreadsheet_id, spreadsheet_title, sheet_name, table_name,
+                            (current_rows, current_cols), sync_options
+                        )
+                        if entry is None:
+                            change_info = {"has_changes": True, "changes": ["Sheet has no data"]}
                         else:
-                            change_info = service._get_sheet_changes(temp_cursor, spreadsheet_id, sheet_name, values)
+                            synced = entry["status"] == "synced"
+                            change_info = {"has_changes": synced, "synced": synced,
+                                           "changes": entry.get("changes", [])}
+                        change_info["last_sync"] = sync_options["sync_time"]
+                    elif grid_changed:
+                        change_info = {
+                            "has_changes": True,
+                            "changes": [f"Row count changed: {stored_grid_rows} → {current_rows}"]
+                        }
+                    else:
+                        # Hash every row as the chunks arrive, fetched the way the last sync fetched them
+                        hasher = ContentHash(service.block_rows)
+                        fetched_rows = 0
+                        fetched_cols = 0
+                        async for chunk in service._fetch_synced_values(
+                            sheets_service, spreadsheet_id, sheet_name, current_rows, current_cols, sync_options
+                        ):
+                            hasher.update(service._row_digests(chunk))
+                            if not fetched_rows:
+                                fetched_cols = len(chunk[0])
+                            fetched_rows += len(chunk)
+                        
+                        with service._get_db_connection() as temp_conn:
+                            change_info = service._compare_sheet_state(
+                                temp_conn.cursor(), spreadsheet_id, sheet_name, hasher.hexdigest(),
+                                max(fetched_rows - 1, 0), fetched_cols
+                            )
                     
                     if change_info["has_changes"]:
                         change_entry = {
@@ -1198,56 +3340,34 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                             "table": table_name,
                             "changes": change_info["changes"],
                             "last_sync": change_info.get("last_sync"),
-                            "synced": False
+                            "synced": change_info.get("synced", False)
                         }
                         
-                        # Auto-sync if requested
-                        if auto_sync:
-                            # Re-sync this sheet (simplified version)
-                            if values:
-                                headers = values[0] if values else []
-                                safe_headers = [re.sub(r'[^a-zA-Z0-9_]', '_', h.lower()) for h in headers]
-                                
-                                with service._get_db_connection() as conn:
-                                    cursor = conn.cursor()
-                                    
-                                    # Drop and recreate table
-                                    cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-                                    columns = 'row_id INTEGER PRIMARY KEY, ' + ', '.join([f"{h} TEXT" for h in safe_headers])
-                                    cursor.execute(f"CREATE TABLE {table_name} ({columns})")
-                                    
-                                    # Insert data
-                                    for idx, row in enumerate(values[1:], 1):
-                                        padded_row = row + [''] * (len(headers) - len(row))
-                                        placeholders = ', '.join(['?' for _ in range(len(headers) + 1)])
-                                        cursor.execute(f"INSERT INTO {table_name} VALUES ({placeholders})", [idx] + padded_row)
-                                    
-                                    # Update metadata
-                                    content_hash = service._calculate_content_hash(values)
-                                    cursor.execute("""
-                                        UPDATE _sheet_metadata 
-                                        SET row_count = ?, column_count = ?, content_hash = ?, sync_time = CURRENT_TIMESTAMP
-                                        WHERE spreadsheet_id = ? AND sheet_name = ?
-                                    """, (len(values) - 1, len(headers), content_hash, spreadsheet_id, sheet_name))
-                                    
-                                    conn.commit()
-                                
-                                change_entry["synced"] = True
-                                synced_count += 1
-                        
+                        if change_entry["synced"]:
+                            synced_count += 1
+                        else:
+                            unresolved_spreadsheets.add(spreadsheet_id)
                         changes_found.append(change_entry)
                 
                 except Exception as e:
+                    unresolved_spreadsheets.add(spreadsheet_id)
                     changes_found.append({
                         "spreadsheet": spreadsheet_title,
                         "sheet": sheet_name,
                         "error": str(e)
                     })
             
+            # Remember the Drive version of spreadsheets whose tabs are all in step again
+            for spreadsheet_id, drive_info in drive_versions.items():
+                if (drive_info and spreadsheet_id not in unchanged_spreadsheets
+                        and spreadsheet_id not in unresolved_spreadsheets):
+                    service._record_drive_version(spreadsheet_id, drive_info)
+            
             result = {
                 "status": "success",
                 "total_sheets_checked": len(sheets_to_check),
                 "sheets_with_changes": len(changes_found),
+                "skipped_unchanged_version": skipped_count,
                 "auto_synced": synced_count if auto_sync else 0,
                 "changes": changes_found
             }
@@ -1261,8 +3381,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "batch_sync_changes":
-        # Create fresh service instance for this tool call
-        service = GoogleSheetsService()
+        service = get_service()
         
         max_sheets = arguments.get("max_sheets", 10)
         delay_between_sheets = arguments.get("delay_between_sheets", 1.0)
@@ -1295,13 +3414,28 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                     "message": "No sheets found to sync"
                 }))]
             
-            sheets_service = build('sheets', 'v4', credentials=creds)
+            sheets_service = service.get_sheets_service(creds)
             
             synced_sheets = []
             failed_sheets = []
             skipped_sheets = []
             
+            # Tabs of spreadsheets whose Drive version was already verified need no fetch
+            unchanged_spreadsheets = set()
+            for spreadsheet_id in dict.fromkeys(sheet[0] for sheet in sheets_to_sync):
+                drive_info = await service._get_drive_version(spreadsheet_id)
+                if drive_info and service._drive_version_unchanged(spreadsheet_id, drive_info):
+                    unchanged_spreadsheets.add(spreadsheet_id)
+            
             for i, (spreadsheet_id, spreadsheet_title, sheet_name, table_name) in enumerate(sheets_to_sync):
+                if spreadsheet_id in unchanged_spreadsheets:
+                    skipped_sheets.append({
+                        "spreadsheet": spreadsheet_title,
+                        "sheet": sheet_name,
+                        "reason": "drive_version_unchanged"
+                    })
+                    continue
+                
                 try:
                     # Add delay between sheets
                     if i > 0:
@@ -1316,45 +3450,30 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                         })
                         continue
                     
-                    # Wait for rate limit
-                    await service._wait_for_rate_limit()
-                    
-                    # Get sheet dimensions first
-                    service._record_api_call()
-                    sheet_meta = sheets_service.spreadsheets().get(
-                        spreadsheetId=spreadsheet_id,
-                        ranges=[f"'{sheet_name}'"],
-                        fields="sheets(properties)"
-                    ).execute()
+                    # Get sheet dimensions first (rate limited; one call per spreadsheet)
+                    sheet_props = await service._get_sheet_properties(sheets_service, spreadsheet_id, sheet_name)
                     
                     # Get actual dimensions
-                    sheet_props = sheet_meta['sheets'][0]['properties']
                     grid_props = sheet_props.get('gridProperties', {})
                     total_rows = grid_props.get('rowCount', 0)
                     total_cols = grid_props.get('columnCount', 0)
                     
-                    # Determine column range dynamically
-                    last_col = service._number_to_column(min(total_cols, 26))  # Limit to Z for compatibility
-                    
-                    # Get current sheet data with dynamic range
-                    range_name = f"'{sheet_name}'!A1:{last_col}{min(total_rows, 10000)}"
-                    service._record_api_call()
-                    result = sheets_service.spreadsheets().values().get(
-                        spreadsheetId=spreadsheet_id,
-                        range=range_name
-                    ).execute()
+                    # Get current sheet data the way the last sync fetched it; the range planner
+                    # splits long or wide sheets into blocks
+                    with service._get_db_connection() as temp_conn:
+                        sync_options = service._get_sync_options(temp_conn.cursor(), spreadsheet_id, sheet_name)
+                    _current_sheet.set(sheet_name)
+                    await service._report_progress(rows_expected=min(total_rows, sync_options["max_rows"]))
                     
-                    values = result.get('values', [])
-                    if not values:
+                    # Stream it in like smart_sync; the table is only rewritten if the content changed
+                    entry = await service._resync_tab(
+                        sheets_service, spreadsheet_id, spreadsheet_title, sheet_name, table_name,
+                        (total_rows, total_cols), sync_options
+                    )
+                    if entry is None:
                         continue
                     
-                    # Check for changes
-                    # Create temporary connection for change detection (this will be fixed in Phase 1b)  
-                    with service._get_db_connection() as temp_conn:
-                        temp_cursor = temp_conn.cursor()
-                        change_info = service._get_sheet_changes(temp_cursor, spreadsheet_id, sheet_name, values)
-                    
-                    if not change_info["has_changes"]:
+                    if entry["status"] != "synced":
                         skipped_sheets.append({
                             "spreadsheet": spreadsheet_title,
                             "sheet": sheet_name,
@@ -1362,39 +3481,11 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                         })
                         continue
                     
-                    # Sync the sheet
-                    headers = values[0] if values else []
-                    safe_headers = [re.sub(r'[^a-zA-Z0-9_]', '_', h.lower()) for h in headers]
-                    
-                    with service._get_db_connection() as conn:
-                        cursor = conn.cursor()
-                        
-                        # Drop and recreate table
-                        cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-                        columns = 'row_id INTEGER PRIMARY KEY, ' + ', '.join([f"{h} TEXT" for h in safe_headers])
-                        cursor.execute(f"CREATE TABLE {table_name} ({columns})")
-                        
-                        # Insert data
-                        for idx, row in enumerate(values[1:], 1):
-                            padded_row = row + [''] * (len(headers) - len(row))
-                            placeholders = ', '.join(['?' for _ in range(len(headers) + 1)])
-                            cursor.execute(f"INSERT INTO {table_name} VALUES ({placeholders})", [idx] + padded_row)
-                        
-                        # Update metadata
-                        content_hash = service._calculate_content_hash(values)
-                        cursor.execute("""
-                            UPDATE _sheet_metadata 
-                            SET row_count = ?, column_count = ?, content_hash = ?, sync_time = CURRENT_TIMESTAMP
-                            WHERE spreadsheet_id = ? AND sheet_name = ?
-                        """, (len(values) - 1, len(headers), content_hash, spreadsheet_id, sheet_name))
-                        
-                        conn.commit()
-                    
                     synced_sheets.append({
                         "spreadsheet": spreadsheet_title,
                         "sheet": sheet_name,
-                        "rows": len(values) - 1,
-                        "changes": change_info["changes"]
+                        "rows": entry["rows"],
+                        "changes": entry["changes"]
                     })
                     
                 except Exception as e:
@@ -1414,8 +3505,9 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                 "skipped_sheets": skipped_sheets,
                 "failed_sheets": failed_sheets,
                 "rate_limit_info": {
-                    "api_calls_in_last_minute": len(service.api_calls),
-                    "max_calls_per_minute": service.max_calls_per_minute
+                    "api_calls_in_last_minute": service.rate_limiter.calls_in_last_minute(),
+                    "current_calls_per_minute": round(service.rate_limiter.rate * 60, 1),
+                    "quota_calls_per_minute": SHEETS_QUOTA_PER_MINUTE
                 }
             }
             
@@ -1424,11 +3516,177 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
     
+    elif name == "sync_status":
+        service = get_service()
+        job_id = arguments.get("job_id")
+        
+        try:
+            jobs = service._load_jobs(job_id)
+            if job_id and not jobs:
+                result = {"error": f"Unknown job: {job_id}"}
+            elif job_id:
+                result = service._job_status(jobs[0])
+            else:
+                result = {
+                    "status": "success",
+                    "jobs": [service._job_status(job) for job in jobs]
+                }
+        except Exception as e:
+            result = {"error": str(e)}
+        
+        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    
     else:
         return [TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}))]
 
+def _progress_for_request() -> Optional[Dict[str, Any]]:
+    """Row counters for the MCP request being handled, if its client supplied a progress token"""
+    try:
+        context = app.request_context
+    except LookupError:
+        return None
+    
+    token = context.meta.progressToken if context.meta else None
+    if token is None:
+        return None
+    return {
+        "progress_token": token,
+        "session": context.session,
+        "rows_expected": 0,
+        "rows_fetched": 0,
+        "rows_inserted": 0
+    }
+
+async def start_sync_job(tool: str, arguments: dict) -> Dict[str, Any]:
+    """Start a smart_sync or batch_sync_changes call as a background task and return its job"""
+    now = time.time()
+    job = {
+        "job_id": uuid.uuid4().hex[:12],
+        "tool": tool,
+        "arguments": {key: value for key, value in arguments.items() if key != "background"},
+        "status": "running",
+        "started_at": now,
+        "updated_at": now,
+        "finished_at": None,
+        "rows_expected": 0,
+        "rows_fetched": 0,
+        "rows_inserted": 0,
+        "errors": [],
+        "result": None
+    }
+    _sync_jobs[job["job_id"]] = job
+    await get_service()._save_job(job)
+    
+    task = asyncio.create_task(run_sync_job(job))
+    _sync_job_tasks.add(task)
+    task.add_done_callback(_sync_job_tasks.discard)
+    return job
+
+async def run_sync_job(job: Dict[str, Any]):
+    """Run a job's tool call with progress reporting, then save its outcome"""
+    _current_progress.set(job)
+    try:
+        response = await handle_call_tool(job["tool"], job["arguments"])
+        result = json.loads(response[0].text)
+    except Exception as e:
+        result = {"error": str(e)}
+    
+    # Per-tab failures are listed under "sheets" (smart_sync) or "failed_sheets" (batch_sync_changes)
+    job["errors"] = [entry for entry in result.get("sheets", []) if entry.get("status") == "error"]
+    job["errors"] += result.get("failed_sheets", [])
+    job["status"] = "failed" if "error" in result else "completed"
+    job["result"] = result
+    job["finished_at"] = time.time()
+    
+    # Finished jobs are served from the table; keep the live copy if it could not be saved
+    if await get_service()._save_job(job):
+        _sync_jobs.pop(job["job_id"], None)
+
+async def refresh_stale_tabs(service: GoogleSheetsService) -> Dict[str, int]:
+    """One background refresh cycle: bring stale tabs up to date within REFRESH_CALL_BUDGET API calls.
+    
+    Spreadsheets are handled stalest first. Every API call counts against the
+    budget; once it is spent the smart_sync in progress stops (chunked tabs keep
+    their checkpoint) and its unfinished tabs are counted as deferred.
+    """
+    summary = {"verified": 0, "refreshed": 0, "failed": 0, "deferred": 0}
+    if not service.get_credentials():
+        return summary
+    
+    counter = {"calls": 0, "limit": REFRESH_CALL_BUDGET}
+    token = _api_call_counter.set(counter)
+    drive_versions = {}  # spreadsheet_id -> Drive version seen before this cycle synced its tabs
+    refreshed_tabs = {}  # spreadsheet_id -> tabs brought in step at that version
+    try:
+        for (spreadsheet_id, value_render, keep_formatted, max_rows), sheet_names in service._get_stale_tabs().items():
+            if counter["calls"] >= REFRESH_CALL_BUDGET:
+                break
+            if service._should_debounce(spreadsheet_id):
+                continue
+            
+            # An unchanged Drive version proves the tabs are still in step without fetching them
+            if spreadsheet_id not in drive_versions:
+                drive_versions[spreadsheet_id] = await service._get_drive_version(spreadsheet_id)
+            drive_info = drive_versions[spreadsheet_id]
+            if drive_info and service._drive_version_unchanged(spreadsheet_id, drive_info):
+                service._mark_tabs_fresh(spreadsheet_id, sheet_names)
+                summary["verified"] += len(sheet_names)
+                continue
+            
+            response = await handle_call_tool("smart_sync", {
+                "url": spreadsheet_id,
+                "sheets": sheet_names,
+                "sync_mode": "delta",
+                "value_render": value_render,
+                "keep_formatted": keep_formatted,
+                "max_rows": max_rows
+            })
+            result = json.loads(response[0].text)
+            budget_spent = counter["calls"] >= REFRESH_CALL_BUDGET
+            for entry in result.get("sheets", []):
+                if entry["status"] != "error":
+                    summary["refreshed"] += 1
+                elif budget_spent and entry["error"].startswith("API call budget"):
+                    summary["deferred"] += 1
+                else:
+                    summary["failed"] += 1
+            if "error" in result:
+                if budget_spent and result["error"].startswith("API call budget"):
+                    summary["deferred"] += len(sheet_names)
+                    break
+                logger.warning(f"Background refresh of {spreadsheet_id} failed: {result['error']}")
+                summary["failed"] += len(sheet_names)
+                continue
+            
+            # Once every synced tab of the spreadsheet is in step, remember the version for later cycles
+            in_step = refreshed_tabs.setdefault(spreadsheet_id, set())
+            in_step.update(entry["sheet_name"] for entry in result.get("sheets", [])
+                           if entry["status"] in ("synced", "no_changes"))
+            if drive_info and in_step >= service._get_synced_tab_names(spreadsheet_id):
+                service._record_drive_version(spreadsheet_id, drive_info)
+    finally:
+        _api_call_counter.reset(token)
+    
+    summary["api_calls"] = counter["calls"]
+    return summary
+
+async def run_refresh_scheduler(interval: float):
+    """Refresh stale synced tabs every interval seconds until cancelled"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            summary = await refresh_stale_tabs(get_service())
+            if summary["verified"] or summary["refreshed"] or summary["failed"] or summary["deferred"]:
+                logger.info(f"Background refresh: {summary}")
+        except Exception as e:
+            logger.warning(f"Background refresh failed: {e}")
+
 async def main():
     """Main entry point with proper cleanup"""
+    refresh_task = None
+    if REFRESH_INTERVAL_SECONDS > 0:
+        refresh_task = asyncio.create_task(run_refresh_scheduler(REFRESH_INTERVAL_SECONDS))
+    
     try:
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
             await app.run(
@@ -1449,9 +3707,12 @@ async def main():
         print(f"Server error: {e}", file=sys.stderr)
         raise
     finally:
-        # Clean up any remaining database connections
-        # With our new architecture, this is mostly handled by per-tool cleanup
-        pass
+        if refresh_task:
+            refresh_task.cancel()
+        
+        # Per-call database connections are closed by each tool; release the shared service
+        if _service is not None:
+            _service.cleanup()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,196 @@
+"""Unit tests for the pure helpers of GoogleSheetsService (no Google API calls)"""
+
+import pytest
+
+import mcp_server
+from mcp_server import ContentHash, GoogleSheetsService
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(mcp_server, "PROJECT_ROOT", tmp_path)
+    service = GoogleSheetsService()
+    service.block_rows = 4
+    yield service
+    service.cleanup()
+
+
+def sheet(data_rows):
+    return [["id", "name"]] + [[str(i), f"row {i}"] for i in range(data_rows)]
+
+
+def ingest_hashes(service, rows, chunk_rows):
+    """Content hash and block hashes of rows fed in chunks, the way _load_chunk feeds them"""
+    state = {"hasher": ContentHash(service.block_rows), "block_hashes": {}}
+    state["hasher"].update(service._row_digests(rows[:1]))
+    data = rows[1:]
+    for start in range(0, len(data), chunk_rows):
+        service._hash_blocks(state, data[start:start + chunk_rows], start + 1)
+    return state["hasher"].hexdigest(), state["block_hashes"]
+
+
+# ContentHash
+
+@pytest.mark.parametrize("split", [0, 1, 2, 4, 5, 9, 13])
+def test_content_hash_continues_from_its_state(service, split):
+    rows = sheet(12)
+    expected = service._calculate_content_hash(rows)
+
+    first = ContentHash(service.block_rows)
+    first.update(service._row_digests(rows[:split]))
+    resumed = ContentHash(service.block_rows, first.state())
+    resumed.update(service._row_digests(rows[split:]))
+
+    assert resumed.next_row == len(rows)
+    assert resumed.hexdigest() == expected
+
+
+def test_content_hash_is_order_sensitive(service):
+    rows = sheet(10)
+    swapped = rows[:3] + [rows[4], rows[3]] + rows[5:]
+    assert service._calculate_content_hash(swapped) != service._calculate_content_hash(rows)
+
+
+def test_content_hash_tells_cell_boundaries_and_types_apart(service):
+    assert service._calculate_content_hash([["ab", "c"]]) != service._calculate_content_hash([["a", "bc"]])
+    assert service._calculate_content_hash([["1"]]) != service._calculate_content_hash([[1]])
+
+
+def test_content_hash_ignores_chunking(service):
+    rows = sheet(11)
+    expected = service._calculate_content_hash(rows)
+    for chunk_rows in (1, 3, 4, 7, 20):
+        assert ingest_hashes(service, rows, chunk_rows)[0] == expected
+
+
+# Block hashes
+
+def test_block_hashes_change_only_for_edited_blocks(service):
+    rows = sheet(10)
+    edited = [list(row) for row in rows]
+    edited[6][1] = "changed"  # Data row 6, in block 1
+
+    _, before = ingest_hashes(service, rows, 4)
+    _, after = ingest_hashes(service, edited, 4)
+
+    assert sorted(before) == [0, 1, 2]
+    assert [index for index in before if before[index] != after[index]] == [1]
+
+
+def test_block_started_before_chunk_has_no_hash(service):
+    rows = sheet(10)
+    state = {"hasher": ContentHash(service.block_rows), "block_hashes": {}}
+    state["hasher"].update(service._row_digests(rows[:3]))  # Header and data rows 1-2
+
+    digests, blocks = service._hash_blocks(state, rows[3:8], 3)
+
+    assert len(digests) == 5
+    assert [(start, end, index) for start, end, index, _ in blocks] == [(0, 2, 0), (2, 5, 1)]
+    assert blocks[0][3] is None
+    assert blocks[1][3] == ContentHash.block_hash(digests[2:5]).hex()
+
+
+def test_block_root_needs_every_block(service):
+    assert service._block_root({0: "a", 1: "b"}) is not None
+    assert service._block_root({0: "a", 1: None}) is None
+    assert service._block_root({1: "b"}) is None
+    assert service._block_root({0: "a", 1: "b"}) != service._block_root({0: "b", 1: "a"})
+
+
+# Column types
+
+@pytest.mark.parametrize("values, expected", [
+    (["1", "-20", "0"], "INTEGER"),
+    (["1", "1.5"], "REAL"),
+    (["1.5", "2e-05"], "REAL"),
+    (["1.50"], "TEXT"),
+    (["1e3"], "TEXT"),
+    (["007"], "TEXT"),
+    (["-0"], "TEXT"),
+    (["1234567890123456"], "REAL"),
+    (["12345678901234567890"], "TEXT"),
+    (["TRUE", "FALSE"], "BOOLEAN"),
+    (["2024-01-05", "2024-01-05 10:30"], "DATE"),
+    (["1", "abc"], "TEXT"),
+    (["2024-01-05", "5"], "TEXT"),
+    ([3, 4.5], "REAL"),
+    ([True, "FALSE"], "BOOLEAN"),
+    (["", ""], None),
+])
+def test_infer_column_types(service, values, expected):
+    assert service._infer_column_types([[value] for value in values], 1) == [expected]
+
+
+def test_infer_column_types_pads_short_rows(service):
+    rows = [["1", "x", "TRUE"], ["2"], []]
+    assert service._infer_column_types(rows, 4) == ["INTEGER", "TEXT", "BOOLEAN", None]
+
+
+@pytest.mark.parametrize("current, new, expected", [
+    (None, "INTEGER", "INTEGER"),
+    ("DATE", None, "DATE"),
+    ("INTEGER", "INTEGER", "INTEGER"),
+    ("INTEGER", "REAL", "REAL"),
+    ("REAL", "INTEGER", "REAL"),
+    ("INTEGER", "DATE", "TEXT"),
+    ("BOOLEAN", "INTEGER", "TEXT"),
+    ("TEXT", "REAL", "TEXT"),
+])
+def test_merge_column_types(service, current, new, expected):
+    assert service._merge_column_types(current, new) == expected
+
+
+@pytest.mark.parametrize("text", ["1", "-42", "1.5", "0.30000000000000004", "2e-05", "123456789012345"])
+def test_typed_numbers_read_back_as_the_same_text(service, text):
+    column_type = service._value_type(text)
+    stored = service._typed_value(text, column_type)
+    assert service._real_text(float(stored)) == text
+
+
+# Range planning
+
+def test_stitch_column_blocks_pads_and_trims(service):
+    column_blocks = [(1, 2), (3, 4)]
+    block_values = [
+        [["a", "b"], ["c"], []],
+        [["x"], [], ["", "z"]],
+    ]
+    assert service._stitch_column_blocks(block_values, column_blocks) == [
+        ["a", "b", "x"],
+        ["c"],
+        ["", "", "", "z"],
+    ]
+
+
+def test_stitch_column_blocks_keeps_rows_only_one_block_has(service):
+    rows = service._stitch_column_blocks([[["a"]], [["x"], ["y"]]], [(1, 2), (3, 3)])
+    assert rows == [["a", "", "x"], ["", "", "y"]]
+
+
+def test_next_chunk_rows_growth_is_capped(service):
+    rows = service._next_chunk_rows(1000, service.chunk_target_bytes / 10, 0.1, 1_000_000)
+    assert rows == 1000 * service.chunk_max_growth
+
+
+def test_next_chunk_rows_shrinks_at_once(service):
+    assert service._next_chunk_rows(8000, service.chunk_target_bytes * 4, 1.0, 1_000_000) == 2000
+    assert service._next_chunk_rows(8000, 1000, service.chunk_target_seconds * 2, 1_000_000) == 4000
+
+
+def test_next_chunk_rows_bounds(service):
+    assert service._next_chunk_rows(600, service.chunk_target_bytes * 100, 1.0, 1_000_000) == service.chunk_min_rows
+    assert service._next_chunk_rows(5000, 1000, 0.1, 3000) == 3000
+    assert service._next_chunk_rows(5000, 1000, 0.1, 0) == 1
+
+
+def test_plan_batch_gets_respects_byte_budget(service):
+    service.batch_get_byte_budget = 100
+    specs = [("A", 40), ("B", 40), ("C", 40), ("D", 150), ("E", 10)]
+    assert service._plan_batch_gets(specs) == [["A", "B"], ["C"], ["D"], ["E"]]
+
+
+def test_plan_batch_gets_respects_range_limit(service):
+    service.batch_get_max_ranges = 2
+    specs = [(name, 1) for name in "ABCDE"]
+    assert service._plan_batch_gets(specs) == [["A", "B"], ["C", "D"], ["E"]]
+    assert service._plan_batch_gets([]) == []